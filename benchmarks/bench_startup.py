@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Startup-time benchmark for the GitHub Streak Manager CLI.
+
+Runs main.py once per subcommand under `python -X importtime` and reports
+the wall time, the total import time and which heavy dependencies each
+subcommand loaded. Commands run with an isolated HOME and a proxy that
+refuses connections, so nothing reaches GitHub; commands that need the
+API fail quickly after their imports are done.
+
+    python benchmarks/bench_startup.py --runs 5 --output startup.json
+"""
+
+import os
+import sys
+import json
+import shutil
+import argparse
+import statistics
+import subprocess
+import tempfile
+import time
+from typing import Dict, List
+
+MAIN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+
+# Top-level packages worth reporting when a subcommand loads them
+HEAVY_MODULES = ("requests", "git", "gitdb", "numpy", "asyncio", "multiprocessing")
+
+
+def subcommands(repo_path: str) -> Dict[str, List[str]]:
+    """Subcommand name -> main.py arguments."""
+    return {
+        "python": None,  # Interpreter startup alone, for reference
+        "help": ["--help"],
+        "setup": ["--setup", "--token", "benchmark"],
+        "analyze": ["--analyze", "--username", "octocat", "--no-cache"],
+        "bulk --dry-run": ["--bulk", "--start-date", "2024-01-01", "--end-date", "2024-01-31", "--dry-run"],
+        "bulk": ["--bulk", "--repo", repo_path, "--start-date", "2024-01-01", "--end-date", "2024-01-07",
+                 "--backend", "fast-import"]
+    }
+
+
+def parse_importtime(stderr: str) -> Dict:
+    """Sum the import times and collect the imported top-level packages.
+
+    Lines look like "import time: self [us] | cumulative | imported package",
+    with nested imports indented below their parent.
+    """
+    total_us = 0
+    packages = set()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        total_us += int(self_us)
+        packages.add(name.strip().split(".")[0])
+    return {"import_us": total_us, "packages": packages}
+
+
+def run(arguments: List[str], env: Dict[str, str]) -> Dict:
+    """Run one command under -X importtime and measure it."""
+    command = [sys.executable, "-X", "importtime"] + (["-c", "pass"] if arguments is None else [MAIN] + arguments)
+    start = time.perf_counter()
+    completed = subprocess.run(command, env=env, capture_output=True, text=True, stdin=subprocess.DEVNULL)
+    seconds = time.perf_counter() - start
+
+    result = parse_importtime(completed.stderr)
+    result["seconds"] = seconds
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CLI startup and import time per subcommand")
+    parser.add_argument('--runs', type=int, default=5, help='Runs per subcommand, the median is reported')
+    parser.add_argument('--output', type=str, help='Save the results to this JSON file')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="streak-startup-")
+    home = os.path.join(workdir, "home")
+    os.makedirs(home)
+    with open(os.path.join(home, ".github_streak_manager.ini"), "w") as f:
+        f.write("[github]\ntoken = benchmark\n\n[preferences]\ncache_enabled = no\n")
+
+    repo_path = os.path.join(workdir, "repo")
+    for command in (["init", "-q", repo_path],
+                    ["-C", repo_path, "-c", "user.name=Benchmark", "-c", "user.email=benchmark@example.com",
+                     "commit", "-q", "--allow-empty", "-m", "Initial commit"]):
+        subprocess.run(["git", *command], check=True)
+
+    env = dict(os.environ, HOME=home, HTTPS_PROXY="http://127.0.0.1:9", HTTP_PROXY="http://127.0.0.1:9",
+               NO_PROXY="", GIT_AUTHOR_NAME="Benchmark", GIT_AUTHOR_EMAIL="benchmark@example.com",
+               GIT_COMMITTER_NAME="Benchmark", GIT_COMMITTER_EMAIL="benchmark@example.com")
+
+    results = {}
+    try:
+        for name, arguments in subcommands(repo_path).items():
+            runs = [run(arguments, env) for _ in range(args.runs)]
+            heavy = sorted(package for package in runs[-1]["packages"] if package in HEAVY_MODULES)
+            results[name] = {
+                "seconds": round(statistics.median(r["seconds"] for r in runs), 4),
+                "import_ms": round(statistics.median(r["import_us"] for r in runs) / 1000, 1),
+                "heavy_modules": heavy
+            }
+            print(f"{name:>16}: {results[name]['seconds'] * 1000:7.1f} ms wall, "
+                  f"{results[name]['import_ms']:6.1f} ms imports  {', '.join(heavy) or '-'}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"python": sys.version.split()[0], "runs": args.runs, "subcommands": results}, f, indent=2)
+        print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
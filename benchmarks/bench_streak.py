@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the GitHub Streak Manager hot paths.
+
+Runs backdate_commit, bulk_backdate, create_natural_streak_pattern (also
+interrupted and resumed) and analyze_streak against a throwaway local git repository and a stubbed
+GitHub API, so no network access or token is needed. Results are saved
+as JSON so runs of different versions can be compared:
+
+    python benchmarks/bench_streak.py --output before.json
+    python benchmarks/bench_streak.py --output after.json --compare before.json
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import platform
+import argparse
+import datetime
+import importlib
+import resource
+import tempfile
+import subprocess
+import contextlib
+import multiprocessing
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import JOURNAL_FILE_NAME, CheckpointJournal, StreakManager, _numpy  # noqa: E402
+
+
+class StubResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, status_code: int, data=None, headers: Optional[Dict] = None):
+        self.status_code = status_code
+        self._data = data
+        self.text = json.dumps(data)
+        self.content = self.text.encode("utf-8")
+        self.headers = headers or {}
+        self.links = {}
+
+    def json(self):
+        return self._data
+
+
+class StubGitHubSession:
+    """Serves the REST and GraphQL endpoints the manager uses from generated data.
+
+    Every user gets a deterministic contribution calendar, so runs are
+    comparable. Calls are counted per endpoint.
+    """
+
+    def __init__(self, history_years: int = 3, seed: int = 0):
+        self.headers = {}
+        self.history_years = history_years
+        self.seed = seed
+        self.calls = {}
+        self._calendars = {}
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    def _calendar(self, username: str) -> List[Dict]:
+        """All contribution days of a user, oldest first."""
+        if username not in self._calendars:
+            rng = random.Random(f"{self.seed}:{username}")
+            today = datetime.date.today()
+            days = 365 * self.history_years
+            self._calendars[username] = [
+                {
+                    "date": (today - datetime.timedelta(days=days - 1 - i)).isoformat(),
+                    "contributionCount": rng.choice((0, 0, 1, 2, 3, 5, 8))
+                }
+                for i in range(days)
+            ]
+        return self._calendars[username]
+
+    def _count(self, endpoint: str) -> None:
+        self.calls[endpoint] = self.calls.get(endpoint, 0) + 1
+
+    def _rate_limit_headers(self, resource_name: str) -> Dict:
+        return {
+            "X-RateLimit-Resource": resource_name,
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "4999",
+            "X-RateLimit-Reset": str(int(time.time()) + 3600)
+        }
+
+    def request(self, method: str, url: str, json=None, headers=None, **kwargs) -> StubResponse:
+        path = url.split("api.github.com/", 1)[-1]
+
+        if path == "graphql":
+            self._count("graphql")
+            return StubResponse(200, self._graphql(json["query"], json.get("variables") or {}),
+                                self._rate_limit_headers("graphql"))
+
+        endpoint = path.split("?", 1)[0]
+        self._count(endpoint)
+        headers = dict(self._rate_limit_headers("core"), ETag=f'"{endpoint}"')
+        if endpoint == "user":
+            return StubResponse(200, {"login": "benchmark"}, headers)
+        if endpoint == "user/repos":
+            return StubResponse(200, [], headers)
+        if endpoint.endswith("/events"):
+            return StubResponse(200, [], headers)
+        return StubResponse(404, {"message": "Not Found"})
+
+    def get(self, url: str, **kwargs) -> StubResponse:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> StubResponse:
+        return self.request("POST", url, **kwargs)
+
+    def _graphql(self, query: str, variables: Dict) -> Dict:
+        days = self._calendar(variables.get("username", "benchmark"))
+
+        if "contributionYears" in query:
+            years = sorted({int(day["date"][:4]) for day in days}, reverse=True)
+            return {"data": {"user": {"contributionsCollection": {"contributionYears": years}}}}
+
+        if "from" in variables:
+            start, end = variables["from"][:10], variables["to"][:10]
+            selected = [day for day in days if start <= day["date"] <= end]
+        else:
+            selected = days[-371:]
+
+        weeks = [{"contributionDays": selected[i:i + 7]} for i in range(0, len(selected), 7)]
+        calendar = {"weeks": weeks}
+        return {"data": {"user": {"contributionsCollection": {"contributionCalendar": calendar}}}}
+
+
+class PhaseTimer:
+    """Accumulates wall-clock time spent in selected manager methods."""
+
+    def __init__(self, manager: StreakManager, method_names: List[str]):
+        self.seconds = {name: 0.0 for name in method_names}
+        for name in method_names:
+            setattr(manager, name, self._wrap(name, getattr(manager, name)))
+
+    def _wrap(self, name: str, method):
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.seconds[name] += time.perf_counter() - start
+        return timed
+
+    def phases(self) -> Dict[str, float]:
+        return {name: round(seconds, 6) for name, seconds in self.seconds.items() if seconds}
+
+
+# Manager methods timed as phases in every scenario
+PHASE_METHODS = [
+    "plan_bulk_backdate",
+    "plan_natural_streak_pattern",
+    "execute_plan",
+    "_get_contribution_days",
+    "_streak_info",
+    "_push"
+]
+
+
+def git(repo_path: str, *args: str) -> str:
+    """Run a git command in the benchmark repository."""
+    return subprocess.run(["git", *args], cwd=repo_path, check=True,
+                          capture_output=True, text=True).stdout.strip()
+
+
+def create_repository(workdir: str) -> str:
+    """Create a throwaway repository with one commit and a local bare remote."""
+    remote = os.path.join(workdir, "remote.git")
+    repo_path = os.path.join(workdir, "repo")
+    git(workdir, "init", "-q", "--bare", remote)
+    git(workdir, "init", "-q", repo_path)
+    git(repo_path, "config", "user.name", "Benchmark")
+    git(repo_path, "config", "user.email", "benchmark@example.com")
+    git(repo_path, "remote", "add", "origin", remote)
+
+    with open(os.path.join(repo_path, "README.md"), "w") as f:
+        f.write("# Benchmark repository\n")
+    git(repo_path, "add", "README.md")
+    git(repo_path, "commit", "-q", "-m", "Initial commit")
+    git(repo_path, "push", "-q", "-u", "origin", "HEAD")
+    return repo_path
+
+
+def commit_count(repo_path: str) -> int:
+    return int(git(repo_path, "rev-list", "--count", "HEAD"))
+
+
+def peak_rss_kb() -> int:
+    """Peak resident set size of the current process so far."""
+    scale = 1024 if sys.platform == "darwin" else 1  # ru_maxrss is bytes on macOS
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // scale
+
+
+def run_scenario(name: str, workdir: str, config_path: str, func, repeat: int = 1) -> Dict:
+    """Run one scenario on a fresh repository and manager, and collect its metrics.
+
+    Args:
+        name: Scenario name
+        workdir: Scratch directory
+        config_path: Manager config file
+        func: Called as func(manager, repo_path) for every repetition
+        repeat: Number of repetitions
+    """
+    scenario_dir = tempfile.mkdtemp(prefix=f"{name}-", dir=workdir)
+    repo_path = create_repository(scenario_dir)
+
+    manager = StreakManager(config_path)
+    stub = StubGitHubSession()
+    manager._session = stub
+    timer = PhaseTimer(manager, PHASE_METHODS)
+
+    commits_before = commit_count(repo_path)
+    start = time.perf_counter()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(repeat):
+            func(manager, repo_path)
+    seconds = time.perf_counter() - start
+    commits = commit_count(repo_path) - commits_before
+
+    result = {
+        "seconds": round(seconds, 6),
+        "repeat": repeat,
+        "commits": commits,
+        "commits_per_sec": round(commits / seconds, 2) if commits else None,
+        "api_calls": stub.total_calls,
+        "api_calls_per_run": round(stub.total_calls / repeat, 2),
+        "api_calls_by_endpoint": stub.calls,
+        "phases": timer.phases(),
+        "peak_rss_kb": peak_rss_kb()
+    }
+    shutil.rmtree(scenario_dir, ignore_errors=True)
+    return result
+
+
+def _scenario_process(sender, *arguments) -> None:
+    """Child process entry point of run_isolated."""
+    try:
+        sender.send((run_scenario(*arguments), None))
+    except BaseException as e:
+        sender.send((None, f"{type(e).__name__}: {e}"))
+
+
+def run_isolated(name: str, workdir: str, config_path: str, func, repeat: int = 1) -> Dict:
+    """Run a scenario with run_scenario in a forked child process.
+
+    ru_maxrss only ever grows within a process, so each scenario gets its own
+    process for its peak RSS to be its own rather than that of every scenario
+    before it.
+
+    Raises:
+        RuntimeError: If the scenario failed
+    """
+    context = multiprocessing.get_context("fork")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_scenario_process, args=(sender, name, workdir, config_path, func, repeat))
+    process.start()
+    sender.close()
+    try:
+        result, error = receiver.recv()
+    except EOFError:  # The child died without reporting
+        result, error = None, None
+    process.join()
+
+    if result is None:
+        raise RuntimeError(f"Scenario {name} failed: {error or f'exit code {process.exitcode}'}")
+    return result
+
+
+def date_range(days: int) -> List[str]:
+    """The last `days` days before today, oldest first."""
+    today = datetime.date.today()
+    return [(today - datetime.timedelta(days=days - i)).isoformat() for i in range(days)]
+
+
+def build_scenarios(args) -> Dict:
+    """Scenario name -> (function, repetitions)."""
+    dates = date_range(args.days)
+    start_date, end_date = dates[0], dates[-1]
+
+    def backdate_commit(manager, repo_path):
+        for date in dates[:args.single_commits]:
+            manager.backdate_commit(repo_path, date)
+
+    def bulk_backdate(backend):
+        def run(manager, repo_path):
+            manager.bulk_backdate(repo_path, dates, commit_count=args.commit_count, push=args.push,
+                                  backend=backend, seed=args.seed)
+        return run
+
+    def natural_pattern(backend):
+        def run(manager, repo_path):
+            manager.create_natural_streak_pattern(repo_path, start_date, end_date,
+                                                  reference_username="reference", push=args.push,
+                                                  backend=backend, seed=args.seed)
+        return run
+
+    def natural_resume(manager, repo_path):
+        # Unseeded, so the resumed run only matches if it reuses the journal's plan
+        base = git(repo_path, "rev-parse", "HEAD")
+        backdate_commit = manager.backdate_commit
+        written = []
+
+        def interrupted(*args_, **kwargs):
+            if len(written) >= args.days // 2:
+                raise KeyboardInterrupt
+            written.append(None)
+            return backdate_commit(*args_, **kwargs)
+
+        manager.backdate_commit = interrupted
+        try:
+            manager.create_natural_streak_pattern(repo_path, start_date, end_date, reference_username="reference")
+        except KeyboardInterrupt:
+            pass
+        manager.backdate_commit = backdate_commit
+
+        api_calls = manager._session.total_calls
+        results = manager.create_natural_streak_pattern(repo_path, start_date, end_date,
+                                                        reference_username="reference", resume=True)
+
+        journal = CheckpointJournal(os.path.join(repo_path, ".git", JOURNAL_FILE_NAME))
+        journal.load()
+        subjects = git(repo_path, "log", "--reverse", "--format=%s", f"{base}..HEAD").splitlines()
+        if (not all(results.values()) or not journal.finished or manager._session.total_calls != api_calls
+                or subjects != [commit.message.splitlines()[0] for commit in journal.plan.commits]):
+            raise AssertionError("Resumed natural pattern does not match the interrupted run's plan")
+
+    def analyze_streak(manager, repo_path):
+        manager.analyze_streak("benchmark")
+
+    def analyze_history(manager, repo_path):
+        manager.analyze_streak("benchmark", history=True)
+
+    return {
+        "backdate_commit": (backdate_commit, 1),
+        "bulk_backdate[commit]": (bulk_backdate("commit"), 1),
+        "bulk_backdate[fast-import]": (bulk_backdate("fast-import"), 1),
+        "bulk_backdate[objects]": (bulk_backdate("objects"), 1),
+        "natural_pattern[commit]": (natural_pattern("commit"), 1),
+        "natural_pattern[fast-import]": (natural_pattern("fast-import"), 1),
+        "natural_pattern[objects]": (natural_pattern("objects"), 1),
+        "natural_pattern[resume]": (natural_resume, 1),
+        "analyze_streak": (analyze_streak, args.analyze_runs),
+        "analyze_streak[history]": (analyze_history, args.analyze_runs)
+    }
+
+
+def source_version() -> Optional[str]:
+    """Commit of the benchmarked code, if it is a git checkout."""
+    try:
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        version = git(root, "rev-parse", "--short", "HEAD")
+        return version + ("-dirty" if git(root, "status", "--porcelain", "--", "main.py") else "")
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: Dict, baseline: Dict) -> None:
+    """Print the change of the key metrics against a baseline result file."""
+    print(f"\nCompared with {baseline.get('version') or 'baseline'}:")
+    for name, current in results["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if not previous:
+            print(f"  {name}: no baseline")
+            continue
+
+        changes = []
+        for metric in ("seconds", "commits_per_sec", "api_calls_per_run"):
+            old, new = previous.get(metric), current.get(metric)
+            if old and new is not None:
+                changes.append(f"{metric} {old} -> {new} ({(new - old) / old:+.1%})")
+        print(f"  {name}: " + ", ".join(changes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the GitHub Streak Manager hot paths")
+    parser.add_argument('--days', type=int, default=60, help='Number of dates for the batch scenarios')
+    parser.add_argument('--commit-count', type=int, default=3, help='Maximum commits per date for bulk_backdate')
+    parser.add_argument('--single-commits', type=int, default=25,
+                        help='Number of commits for the backdate_commit scenario')
+    parser.add_argument('--analyze-runs', type=int, default=20, help='Repetitions of the analyze_streak scenarios')
+    parser.add_argument('--push', action='store_true', help='Push to a local bare remote in the batch scenarios')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed for the generated commit patterns')
+    parser.add_argument('--scenario', type=str, nargs='+', help='Only run scenarios whose name starts with these')
+    parser.add_argument('--output', type=str, help='Save the results to this JSON file')
+    parser.add_argument('--compare', type=str, help='Baseline JSON file to compare against')
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    workdir = tempfile.mkdtemp(prefix="streak-bench-")
+    config_path = os.path.join(workdir, "config.ini")
+    with open(config_path, "w") as f:
+        f.write("[github]\ntoken = benchmark\n\n[preferences]\ncache_enabled = no\n")
+
+    results = {
+        "version": source_version(),
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "git": git(workdir, "--version"),
+        "parameters": vars(args),
+        "scenarios": {}
+    }
+
+    # Load the lazily imported dependencies before forking, so no scenario's time includes them
+    for module in ("git", "gitdb", "requests"):
+        importlib.import_module(module)
+    _numpy()
+
+    try:
+        for name, (func, repeat) in build_scenarios(args).items():
+            if args.scenario and not any(name.startswith(prefix) for prefix in args.scenario):
+                continue
+
+            result = run_isolated(name, workdir, config_path, func, repeat)
+            results["scenarios"][name] = result
+
+            rate = f", {result['commits_per_sec']} commits/s" if result["commits"] else ""
+            print(f"{name}: {result['seconds']:.3f}s{rate}, {result['api_calls']} API calls, "
+                  f"peak RSS {result['peak_rss_kb']} KB")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
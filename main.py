@@ -2,6 +2,8 @@
 GitHub Streak Manager - A tool to maintain GitHub contribution streaks.
 """
 
+from __future__ import annotations
+
 import os
 import sys
 import random
@@ -9,13 +11,1434 @@ import argparse
 import configparser
 import datetime
 import subprocess
+import csv
 import json
+import math
+import bisect
+import threading
+import hashlib
+import io
+import struct
 import time
+import tempfile
+import contextlib
+import urllib.parse
+from array import array
 from pathlib import Path
-from typing import List, Dict, Optional, Union, Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Dict, Optional, Union, Tuple, Iterator
+
+# requests, GitPython, NumPy and asyncio are imported by the code paths that
+# use them, so commands like --help and --analyze don't load GitPython
+if TYPE_CHECKING:
+    import requests
+    from git import Repo
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """Import NumPy on first use, or return None if it is not installed."""
+    try:
+        import numpy
+    except ImportError:  # NumPy is optional, used for batched sampling
+        return None
+    return numpy
+
+# Ways of writing generated commits: one `git commit` per commit, a single
+# `git fast-import` stream for the whole batch, or objects written directly
+# into the object database
+COMMIT_BACKENDS = ("commit", "fast-import", "objects")
+
+# Git tree entry modes
+BLOB_MODE = 0o100644
+TREE_MODE = 0o40000
+
+# Connection pool size for the shared GitHub API session
+HTTP_POOL_SIZE = 16
+
+# Maximum number of concurrent GitHub API requests within one call
+API_MAX_WORKERS = 8
+
+# Users per aliased GraphQL document in analyze_streaks, keeps the query
+# well below GitHub's node and complexity limits
+GRAPHQL_USERS_PER_QUERY = 25
+
+# Contribution calendar selection shared by the GraphQL queries
+CONTRIBUTION_CALENDAR_FIELDS = """
+contributionCalendar {
+  weeks {
+    contributionDays {
+      date
+      contributionCount
+    }
+  }
+}
+"""
+
+# When to push during batch runs: once after all commits, after every date,
+# or after every N dates
+PUSH_STRATEGIES = ("end", "per-date", "every-n")
+
+
+class PacingPolicy:
+    """Wall-clock pacing for batch commit generation.
+    
+    Commit timestamps come from GIT_AUTHOR_DATE/GIT_COMMITTER_DATE, so by
+    default nothing is slept. A delay between commits and a push rate limit
+    can be set explicitly, e.g. to be gentle with a remote during real pushes.
+    """
+    
+    def __init__(self,
+                 commit_delay: Tuple[float, float] = (0.0, 0.0),
+                 pushes_per_minute: Optional[float] = None):
+        """Initialize the pacing policy.
+        
+        Args:
+            commit_delay: (min, max) seconds to wait between commits on the same date
+            pushes_per_minute: Maximum push rate, None for no limit
+        """
+        if pushes_per_minute is not None and pushes_per_minute <= 0:
+            raise ValueError("pushes_per_minute must be positive")
+        
+        self.commit_delay = commit_delay
+        self.pushes_per_minute = pushes_per_minute
+        self.throttled_seconds = 0.0
+        self._last_push = None
+    
+    def _sleep(self, seconds: float) -> None:
+        """Sleep and account the time as throttled."""
+        if seconds > 0:
+            time.sleep(seconds)
+            self.throttled_seconds += seconds
+    
+    def before_commit(self, commit_index: int) -> None:
+        """Wait before creating a commit.
+        
+        Args:
+            commit_index: Index of the commit within its date (0-based)
+        """
+        low, high = self.commit_delay
+        if commit_index > 0 and high > 0:
+            self._sleep(random.uniform(low, high))
+    
+    def before_push(self) -> None:
+        """Wait until the push rate limit allows another push."""
+        if self.pushes_per_minute and self._last_push is not None:
+            interval = 60.0 / self.pushes_per_minute
+            self._sleep(interval - (time.monotonic() - self._last_push))
+        self._last_push = time.monotonic()
+
+
+# Timestamp format used for GIT_AUTHOR_DATE/GIT_COMMITTER_DATE
+GIT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _date_range(start_date: str, end_date: str) -> List[str]:
+    """Every date from start_date through end_date, both in YYYY-MM-DD format."""
+    start = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
+    days = (datetime.datetime.strptime(end_date, "%Y-%m-%d").date() - start).days + 1
+    return [(start + datetime.timedelta(days=i)).isoformat() for i in range(days)]
+
+
+def _raw_git_date(timestamp: str) -> str:
+    """Convert a GIT_DATE_FORMAT timestamp to git's raw "<epoch> <+hhmm>" date format.
+    
+    Naive timestamps are local time, exactly like GIT_AUTHOR_DATE.
+    """
+    when = datetime.datetime.strptime(timestamp, GIT_DATE_FORMAT).astimezone()
+    return f"{int(when.timestamp())} {when.strftime('%z')}"
+
+
+class PlannedCommit:
+    """A single commit in a CommitPlan."""
+    
+    __slots__ = ("date", "timestamp", "path", "message", "content_ref")
+    
+    def __init__(self, date: str, timestamp: str, path: str, message: str, content_ref: int):
+        """Initialize the planned commit.
+        
+        Args:
+            date: Contribution date in YYYY-MM-DD format
+            timestamp: Commit timestamp in GIT_DATE_FORMAT
+            path: Repository-relative path of the file to write
+            message: Commit message
+            content_ref: Index of the file content in the plan's content pool
+        """
+        self.date = date
+        self.timestamp = timestamp
+        self.path = path
+        self.message = message
+        self.content_ref = content_ref
+    
+    def to_dict(self) -> Dict:
+        """Return the commit as a JSON-serializable dictionary."""
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
+def _check_plan_path(path: str) -> None:
+    """Reject plan file paths that could write outside the working tree or into .git.
+    
+    Raises:
+        ValueError: For empty or absolute paths, ".." segments and .git paths
+    """
+    parts = path.replace("\\", "/").split("/")
+    if (not path or os.path.isabs(path) or ":" in parts[0]  # Also Windows drives
+            or any(part in ("", ".", "..") or part.lower() == ".git" for part in parts)):
+        raise ValueError(f"Invalid file path in commit plan: {path!r}")
+
+
+class CommitPlan:
+    """A precomputed series of commits, produced by a planner and consumed by an executor.
+    
+    File contents live in a pool shared by all commits, so identical contents
+    are stored once and commits only carry a reference into the pool.
+    """
+    
+    __slots__ = ("dates", "commits", "contents", "_content_refs")
+    
+    def __init__(self, dates: Optional[List[str]] = None):
+        """Initialize an empty plan.
+        
+        Args:
+            dates: Dates covered by the plan, including dates without commits
+        """
+        self.dates = list(dates or [])
+        self.commits = []
+        self.contents = []
+        self._content_refs = {}
+    
+    def __len__(self) -> int:
+        return len(self.commits)
+    
+    def add_commit(self, date: str, timestamp: str, path: str, message: str, content: str) -> PlannedCommit:
+        """Append a commit to the plan.
+        
+        Args:
+            date: Contribution date in YYYY-MM-DD format
+            timestamp: Commit timestamp in GIT_DATE_FORMAT
+            path: Repository-relative path of the file to write
+            message: Commit message
+            content: File content to write
+            
+        Returns:
+            The planned commit
+        """
+        content_ref = self._content_refs.get(content)
+        if content_ref is None:
+            content_ref = len(self.contents)
+            self.contents.append(content)
+            self._content_refs[content] = content_ref
+        
+        commit = PlannedCommit(date, timestamp, path, message, content_ref)
+        self.commits.append(commit)
+        return commit
+    
+    def content(self, commit: PlannedCommit) -> str:
+        """Return the file content of a planned commit."""
+        return self.contents[commit.content_ref]
+    
+    def commits_by_date(self) -> Dict[str, List[PlannedCommit]]:
+        """Group the planned commits by date, keeping commit order."""
+        grouped = {}
+        for commit in self.commits:
+            grouped.setdefault(commit.date, []).append(commit)
+        return grouped
+    
+    def tail(self, start: int) -> "CommitPlan":
+        """Return a plan with the same dates and contents holding the commits from index start on."""
+        plan = CommitPlan(self.dates)
+        plan.contents = self.contents
+        plan._content_refs = self._content_refs
+        plan.commits = self.commits[start:]
+        return plan
+    
+    def summary(self) -> Dict:
+        """Return day and commit counts for the plan."""
+        active_days = len({commit.date for commit in self.commits})
+        return {
+            "total_days": len(self.dates),
+            "active_days": active_days,
+            "total_commits": len(self.commits),
+            "unique_contents": len(self.contents)
+        }
+    
+    def to_dict(self) -> Dict:
+        """Return the plan as a JSON-serializable dictionary."""
+        return {
+            "version": 1,
+            "dates": self.dates,
+            "contents": self.contents,
+            "commits": [commit.to_dict() for commit in self.commits]
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "CommitPlan":
+        """Build a plan from a dictionary created by to_dict."""
+        if data.get("version") != 1:
+            raise ValueError(f"Unsupported commit plan version: {data.get('version')}")
+        
+        # Executors walk the dates in order and take each date's commits as a group
+        date_positions = {date_str: position for position, date_str in enumerate(data["dates"])}
+        last_position = 0
+        for commit in data["commits"]:
+            _check_plan_path(commit["path"])
+            
+            position = date_positions.get(commit["date"])
+            if position is None:
+                raise ValueError(f"Commit plan has a commit on {commit['date']}, which is not one of its dates")
+            if position < last_position:
+                raise ValueError(f"Commit plan commits are not in date order: {commit['date']}")
+            last_position = position
+            
+            content_ref = commit["content_ref"]
+            if type(content_ref) is not int or not 0 <= content_ref < len(data["contents"]):
+                raise ValueError(f"Commit plan content reference out of range: {content_ref!r}")
+        
+        plan = cls(data["dates"])
+        plan.contents = list(data["contents"])
+        plan._content_refs = {content: ref for ref, content in enumerate(plan.contents)}
+        plan.commits = [
+            PlannedCommit(c["date"], c["timestamp"], c["path"], c["message"], c["content_ref"])
+            for c in data["commits"]
+        ]
+        return plan
+    
+    def save(self, path: str) -> None:
+        """Save the plan as JSON."""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=1)
+    
+    @classmethod
+    def load(cls, path: str) -> "CommitPlan":
+        """Load a plan saved with save()."""
+        with open(path, 'r') as f:
+            return cls.from_dict(json.load(f))
+
+
+# File name of the checkpoint journal inside a repository's git directory
+JOURNAL_FILE_NAME = "streak-manager-journal.jsonl"
+
+
+class CheckpointJournal:
+    """Write-ahead journal of a plan execution, for resuming interrupted runs.
+    
+    The journal is a JSON lines file. The first record holds the plan, the
+    HEAD the run started from and a description of the run (the planner and
+    its options, see run_description); every later record is appended and
+    fsynced before the run moves on:
+    
+        {"type": "plan", "plan": {...}, "base": "<sha or null>", "run": {...}}
+        {"type": "commits", "start": 0, "shas": ["<sha>", ...]}
+        {"type": "push", "sha": "<sha>"}
+        {"type": "done"}
+    
+    Commits are identified by their index in the plan, so the SHAs recorded
+    so far are exactly the first len(shas) commits of the plan. A torn
+    last line from a crash mid-write is ignored.
+    """
+    
+    def __init__(self, path: str):
+        """Initialize the journal.
+        
+        Args:
+            path: Path of the journal file
+        """
+        self.path = path
+        self.plan = None
+        self.base = None
+        self.run = None
+        self.shas = []
+        self.pushed = None
+        self.finished = False
+        self._file = None
+    
+    @property
+    def completed(self) -> int:
+        """Number of planned commits known to be written."""
+        return len(self.shas)
+    
+    @property
+    def head(self) -> Optional[str]:
+        """SHA of the last durable point of the run."""
+        return self.shas[-1] if self.shas else self.base
+    
+    def load(self) -> bool:
+        """Read the journal file.
+        
+        Returns:
+            True if the file exists and holds a plan
+        """
+        try:
+            with open(self.path, 'r') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return False
+        
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break  # Torn write, everything before it is durable
+            
+            if record["type"] == "plan":
+                self.plan = CommitPlan.from_dict(record["plan"])
+                self.base = record["base"]
+                self.run = record.get("run")
+            elif record["type"] == "commits":
+                del self.shas[record["start"]:]
+                self.shas.extend(record["shas"])
+            elif record["type"] == "push":
+                self.pushed = record["sha"]
+            elif record["type"] == "done":
+                self.finished = True
+        
+        return self.plan is not None
+    
+    @staticmethod
+    def run_description(plan: CommitPlan, run: Optional[Dict] = None) -> Dict:
+        """Describe a run for matching it against a journal on resume.
+        
+        Args:
+            plan: Plan of the run
+            run: Planner and options that produced the plan, e.g.
+                {"kind": "natural", "start_date": ..., "seed": None}; plans
+                that were not planned for this run are described by a
+                digest of their contents
+            
+        Returns:
+            The description as stored in the journal
+        """
+        if run is None:
+            digest = hashlib.sha1(json.dumps(plan.to_dict(), sort_keys=True).encode("utf-8")).hexdigest()
+            run = {"kind": "plan", "digest": digest}
+        return json.loads(json.dumps(run))  # Normalized as read back from the journal
+    
+    def start(self, plan: CommitPlan, base: Optional[str], run: Dict) -> None:
+        """Replace the journal with a new run.
+        
+        Args:
+            plan: Plan of the run
+            base: SHA of HEAD before the run, None for an empty repository
+            run: Description of the run, see run_description
+        """
+        self.plan = plan
+        self.base = base
+        self.run = run
+        self.shas = []
+        self.pushed = None
+        self.finished = False
+        
+        # Write the header next to the journal and rename it over the old run
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w') as f:
+            f.write(json.dumps({"type": "plan", "plan": plan.to_dict(), "base": base, "run": run}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+    
+    def _append(self, record: Dict) -> None:
+        """Append a record and make it durable."""
+        if self._file is None:
+            self._file = open(self.path, 'a')
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+    
+    def record_commits(self, start: int, shas: List[str]) -> None:
+        """Record written commits.
+        
+        Args:
+            start: Plan index of the first commit
+            shas: SHAs of the commits, in plan order
+            
+        Raises:
+            ValueError: If the commits would leave a gap after the recorded ones
+        """
+        if start > len(self.shas):
+            raise ValueError(f"Cannot journal commit {start}, only {len(self.shas)} commits are recorded")
+        self._append({"type": "commits", "start": start, "shas": shas})
+        del self.shas[start:]
+        self.shas.extend(shas)
+    
+    def record_push(self, sha: str) -> None:
+        """Record that the branch was pushed up to a commit."""
+        self._append({"type": "push", "sha": sha})
+        self.pushed = sha
+    
+    def finish(self) -> None:
+        """Mark the run as finished."""
+        self._append({"type": "done"})
+        self.finished = True
+    
+    def close(self) -> None:
+        """Close the journal file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _planner_run(kind: str, **options) -> Dict:
+    """Describe a planner run for its checkpoint journal, see CheckpointJournal.run_description."""
+    return dict(options, kind=kind)
+
+
+# Content templates of generated files by extension, rendered with
+# str.format(date, compact_date, index, number, total, extension)
+CONTENT_TEMPLATES = {
+    "md": "# Update for {date}\n\nDocumentation update #{number}.\n\n## Changes\n\n- Updated documentation\n- Improved examples\n- Fixed typos",
+    "py": '''"""
+Module updated on {date}
+"""
+
+def sample_function_{compact_date}_{index}():
+    """Example function added in update #{number}."""
+    print("Sample function implementation")
+    return True
+
+# Added in update #{number}
+class SampleClass:
+    """Example class for demonstration."""
+    
+    def __init__(self):
+        """Initialize the class."""
+        self.value = "{date}"
+    
+    def get_value(self):
+        """Return the stored value."""
+        return self.value
+''',
+    "json": '''{{
+  "update_date": "{date}",
+  "update_number": {number},
+  "changes": [
+    "Updated configuration",
+    "Modified settings",
+    "Adjusted parameters"
+  ]
+}}'''
+}
+FALLBACK_CONTENT_TEMPLATE = "# Update for {date}\n\nCommit #{number} of {total}\n\nGenerated content for file type: {extension}"
+
+
+class ContentEngine:
+    """Generates file contents and commit messages for planned commits.
+    
+    Templates are module-level format strings bound once, and the file
+    types and message pools are immutable tuples, so nothing is rebuilt per
+    date or per commit. render_batch renders a whole plan at once and
+    renders each distinct (template, date, number, total) only once, so
+    identical contents are the same string and share one blob.
+    """
+    
+    # Files modified by generated commits, under streak_updates/<date>/
+    FILE_TYPES = (
+        "docs/updates.md",
+        "src/main.py",
+        "utils/helpers.py",
+        "config/settings.json",
+        "README.md",
+        "tests/test_main.py",
+        "data/sample.json"
+    )
+    
+    INITIAL_MESSAGES = (
+        "Initial commit",
+        "Initialize project structure",
+        "Setup project boilerplate",
+        "First commit",
+        "Create basic project structure",
+        "Start new project",
+        "Set up repository"
+    )
+    
+    DOC_MESSAGES = (
+        "Update documentation",
+        "Improve README clarity",
+        "Add installation instructions",
+        "Update usage examples",
+        "Fix typo in documentation",
+        "Add section on advanced usage",
+        "Document new feature",
+        "Update API documentation",
+        "Add contributing guidelines",
+        "Update changelog"
+    )
+    
+    FINAL_MESSAGES = (
+        "Final adjustments",
+        "Clean up code before pushing",
+        "Fix minor issues",
+        "Apply code review feedback",
+        "Prepare for deployment",
+        "Ready for release",
+        "Final tweaks before merge"
+    )
+    
+    CODE_MESSAGES = (
+        "Update functionality",
+        "Refactor code for better readability",
+        "Optimize performance",
+        "Fix bug in error handling",
+        "Improve code structure",
+        "Add new feature",
+        "Fix edge case",
+        "Implement requested changes",
+        "Clean up code formatting",
+        "Improve error messages",
+        "Add better comments",
+        "Refactor utility functions",
+        "Remove deprecated code",
+        "Add unit tests",
+        "Fix linting issues",
+        "Improve logging",
+        "Update dependencies",
+        "Add error handling",
+        "Implement feedback from code review",
+        "Fix security vulnerability",
+        "Update API endpoint",
+        "Add new helper method",
+        "Make code more maintainable",
+        "Simplify complex logic",
+        "Fix regression"
+    )
+    
+    def __init__(self):
+        """Bind the content templates by file extension."""
+        self._renderers = {extension: template.format for extension, template in CONTENT_TEMPLATES.items()}
+        self._render_fallback = FALLBACK_CONTENT_TEMPLATE.format
+    
+    def render(self, file_path: str, date_str: str, index: int, total: int) -> str:
+        """Render the content of one generated file.
+        
+        Args:
+            file_path: Path of the file, its extension selects the template
+            date_str: Date in YYYY-MM-DD format
+            index: Index of the commit within its date (0-based)
+            total: Number of commits on the date
+        """
+        extension = file_path.rsplit(".", 1)[-1]
+        renderer = self._renderers.get(extension, self._render_fallback)
+        return renderer(date=date_str, compact_date=date_str.replace("-", ""), index=index,
+                        number=index + 1, total=total, extension=extension)
+    
+    def render_batch(self, specs: List[Tuple[str, str, int, int]]) -> List[str]:
+        """Render many contents at once.
+        
+        Args:
+            specs: (file_path, date_str, index, total) per content
+            
+        Returns:
+            Contents in spec order; specs rendering to the same template
+            arguments return the same string object
+        """
+        rendered = {}
+        contents = []
+        for file_path, date_str, index, total in specs:
+            key = (file_path.rsplit(".", 1)[-1], date_str, index, total)
+            content = rendered.get(key)
+            if content is None:
+                content = rendered[key] = self.render(file_path, date_str, index, total)
+            contents.append(content)
+        return contents
+    
+    def message(self, file_path: Optional[str] = None, commit_index: int = 0, total_commits: int = 1) -> str:
+        """Pick a realistic commit message for the commit's context.
+        
+        Args:
+            file_path: Path to the file being modified
+            commit_index: Index of the current commit (0-based)
+            total_commits: Total number of commits for this date
+        """
+        # For first commits in a repository
+        if commit_index == 0 and total_commits > 1:
+            return random.choice(self.INITIAL_MESSAGES)
+        
+        # For documentation updates
+        if file_path and ("README" in file_path or "docs/" in file_path or ".md" in file_path):
+            return random.choice(self.DOC_MESSAGES)
+        
+        # For final commits in a series
+        if commit_index == total_commits - 1 and total_commits > 1:
+            return random.choice(self.FINAL_MESSAGES)
+        
+        # General coding messages
+        return random.choice(self.CODE_MESSAGES)
+
+
+class CommitCountSampler:
+    """Draws per-day commit counts for a whole date range in one batch.
+    
+    Each weekday (Monday=0 ... Sunday=6) has a precomputed weight table for
+    0, 1, 2, ... commits. With NumPy available, all dates are sampled with a
+    single vectorized inverse-CDF lookup; otherwise a pure Python loop over
+    random.Random is used. Both are reproducible for a given seed.
+    """
+    
+    def __init__(self, weekday_weights: List[List[float]], seed: Optional[int] = None):
+        """Initialize the sampler.
+        
+        Args:
+            weekday_weights: Seven weight tables, Monday first
+            seed: Seed for reproducible sampling, None for fresh randomness
+        """
+        if len(weekday_weights) != 7:
+            raise ValueError("Exactly seven weekday weight tables are required")
+        
+        # Cumulative, normalized tables; the last entry is exactly 1.0
+        self.cum_weights = []
+        for weights in weekday_weights:
+            total = float(sum(weights))
+            if not weights or total <= 0:
+                raise ValueError(f"Invalid commit count weights: {weights}")
+            
+            running = 0.0
+            cumulative = []
+            for weight in weights:
+                running += weight
+                cumulative.append(running / total)
+            cumulative[-1] = 1.0
+            self.cum_weights.append(cumulative)
+        
+        self.seed = seed
+    
+    @staticmethod
+    def truncated_table(max_count: int, weights: List[float]) -> List[float]:
+        """Fit a weight table to counts 0..max_count.
+        
+        Args:
+            max_count: Highest commit count that may be drawn
+            weights: Relative weights for 0, 1, 2, ... commits
+            
+        Returns:
+            Weights trimmed to max_count, padded with weight 1 if too short
+        """
+        max_count = max(0, max_count)
+        weights = list(weights[:max_count + 1])
+        return weights + [1] * (max_count + 1 - len(weights))
+    
+    @staticmethod
+    def normal_table(mean: float, sigma: float, max_count: int) -> List[float]:
+        """Weight table for int(normalvariate(mean, sigma)) clamped to 0..max_count.
+        
+        Args:
+            mean: Mean of the normal distribution
+            sigma: Standard deviation of the normal distribution
+            max_count: Highest commit count that may be drawn
+            
+        Returns:
+            Probabilities for 0, 1, ..., max_count commits
+        """
+        def cdf(x: float) -> float:
+            return 0.5 * (1.0 + math.erf((x - mean) / (sigma * math.sqrt(2.0))))
+        
+        # int() truncates toward zero, so everything below 1 becomes 0
+        table = [cdf(1)]
+        table.extend(cdf(k + 1) - cdf(k) for k in range(1, max_count))
+        if max_count > 0:
+            table.append(1.0 - cdf(max_count))
+        return table
+    
+    def sample(self, dates: List[str]) -> List[int]:
+        """Draw a commit count for every date.
+        
+        Args:
+            dates: Dates in YYYY-MM-DD format
+            
+        Returns:
+            Commit counts, in the same order as dates
+        """
+        if not dates:
+            return []
+        
+        np = _numpy()
+        if np is not None:
+            rng = np.random.default_rng(self.seed)
+            
+            # 1970-01-01 was a Thursday (weekday 3)
+            days = np.array(dates, dtype="datetime64[D]").astype(np.int64)
+            weekdays = (days + 3) % 7
+            
+            width = max(len(cumulative) for cumulative in self.cum_weights)
+            cdf = np.ones((7, width))
+            for weekday, cumulative in enumerate(self.cum_weights):
+                cdf[weekday, :len(cumulative)] = cumulative
+            
+            # Inverse CDF: the count is the number of table entries <= u
+            u = rng.random(len(dates))
+            return (u[:, None] >= cdf[weekdays]).sum(axis=1).tolist()
+        
+        rng = random.Random(self.seed)
+        counts = []
+        for date_str in dates:
+            cumulative = self.cum_weights[datetime.date.fromisoformat(date_str).weekday()]
+            counts.append(rng.choices(range(len(cumulative)), cum_weights=cumulative, k=1)[0])
+        return counts
+
+
+class DiskCache:
+    """Size-bounded on-disk cache of GitHub API results.
+    
+    Each entry is a JSON file holding the data, the time it was fetched and
+    an optional ETag for conditional revalidation. Entries older than the TTL
+    are stale; the least recently used entries are evicted once the cache
+    holds more than max_entries.
+    """
+    
+    def __init__(self, directory: str, ttl: float = 3600, max_entries: int = 256):
+        """Initialize the cache.
+        
+        Args:
+            directory: Directory to store cache entries in
+            ttl: Seconds an entry is served without revalidation
+            max_entries: Maximum number of entries kept on disk
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.max_entries = max_entries
+    
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the entry for a key, fresh or stale, or None.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Dictionary with 'data', 'fetched_at' and 'etag' keys
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if entry.get("key") != key:
+            return None
+        
+        # The file modification time tracks the last use for LRU eviction
+        os.utime(path)
+        return entry
+    
+    def is_fresh(self, entry: Dict) -> bool:
+        """Whether an entry is younger than the TTL."""
+        return time.time() - entry["fetched_at"] < self.ttl
+    
+    def put(self, key: str, data, etag: Optional[str] = None) -> None:
+        """Store data under a key and evict old entries if needed.
+        
+        Args:
+            key: Cache key
+            data: JSON-serializable data
+            etag: ETag to revalidate the entry with later
+        """
+        self._write(key, {"key": key, "fetched_at": time.time(), "etag": etag, "data": data})
+        self._evict()
+    
+    def expire(self, key: str) -> None:
+        """Mark an entry as stale, so the next lookup fetches it again.
+        
+        Unlike removing it, the data stays available, e.g. as the local
+        store of an incremental sync.
+        """
+        entry = self.get(key)
+        if entry:
+            self._write(key, dict(entry, fetched_at=0, etag=None))
+    
+    def _write(self, key: str, entry: Dict) -> None:
+        """Atomically write an entry file."""
+        os.makedirs(self.directory, exist_ok=True)
+        
+        # Write to a temporary file first so readers never see partial entries;
+        # each writer gets its own, as threads may store the same key at once
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+    
+    def revalidated(self, key: str, entry: Dict) -> None:
+        """Mark a stale entry as fresh again after a 304 response."""
+        self.put(key, entry["data"], entry.get("etag"))
+    
+    def _evict(self) -> None:
+        """Remove the least recently used entries beyond max_entries."""
+        try:
+            names = [name for name in os.listdir(self.directory) if name.endswith(".json")]
+        except OSError:
+            return
+        
+        if len(names) <= self.max_entries:
+            return
+        
+        paths = [os.path.join(self.directory, name) for name in names]
+        paths.sort(key=lambda path: os.path.getmtime(path))
+        for path in paths[:len(paths) - self.max_entries]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
+    def clear(self) -> None:
+        """Remove every cache entry."""
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                os.remove(os.path.join(self.directory, name))
+
+
+class GitHubAPIError(Exception):
+    """Error response from the GitHub REST or GraphQL API."""
+    
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class RateLimiter:
+    """Tracks GitHub API budgets and schedules requests and retries.
+    
+    Budgets are read per resource ("core" for REST, "graphql") from the
+    X-RateLimit-* response headers. Once the remaining budget drops below
+    a reserve, requests are spread evenly over the time left until the
+    reset, and an exhausted budget waits for the reset instead of failing.
+    Rate-limited (403/429) and server error (5xx) responses are retried
+    with jittered exponential backoff, honouring Retry-After.
+    """
+    
+    def __init__(self,
+                 max_retries: int = 5,
+                 base_backoff: float = 1.0,
+                 max_backoff: float = 60.0,
+                 reserve_fraction: float = 0.1):
+        """Initialize the rate limiter.
+        
+        Args:
+            max_retries: Retries per request before giving up
+            base_backoff: Backoff in seconds for the first retry
+            max_backoff: Upper bound for a single backoff
+            reserve_fraction: Share of the budget below which requests are paced
+        """
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.reserve_fraction = reserve_fraction
+        
+        self.budgets = {}
+        self.requests = 0
+        self.retries = 0
+        self.throttled_seconds = 0.0
+        self._lock = threading.Lock()
+    
+    def _sleep(self, seconds: float) -> None:
+        """Sleep and account the time as throttled."""
+        if seconds > 0:
+            time.sleep(seconds)
+            with self._lock:
+                self.throttled_seconds += seconds
+    
+    def before_request(self, resource: str) -> None:
+        """Wait as long as needed to stay within the budget of a resource.
+        
+        Args:
+            resource: "core" or "graphql"
+        """
+        delay = 0.0
+        with self._lock:
+            self.requests += 1
+            budget = self.budgets.get(resource)
+            now = time.time()
+            
+            if budget and budget["reset"] > now:
+                if budget["remaining"] <= 0:
+                    delay = budget["reset"] - now
+                elif budget["remaining"] < budget["limit"] * self.reserve_fraction:
+                    delay = (budget["reset"] - now) / budget["remaining"]
+                
+                # Claim a unit now so concurrent callers see it spent
+                budget["remaining"] -= 1
+        
+        self._sleep(delay)
+    
+    def record(self, resource: str, response: requests.Response) -> None:
+        """Update the budget of a resource from response headers.
+        
+        Args:
+            resource: "core" or "graphql", used if the response names none
+            response: Response carrying X-RateLimit-* headers
+        """
+        headers = response.headers
+        if "X-RateLimit-Remaining" not in headers:
+            return
+        
+        resource = headers.get("X-RateLimit-Resource", resource)
+        with self._lock:
+            self.budgets[resource] = {
+                "limit": int(headers.get("X-RateLimit-Limit", 0)),
+                "remaining": int(headers["X-RateLimit-Remaining"]),
+                "used": int(headers.get("X-RateLimit-Used", 0)),
+                "reset": int(headers.get("X-RateLimit-Reset", 0))
+            }
+    
+    def retry_delay(self, resource: str, response: requests.Response, attempt: int) -> Optional[float]:
+        """Return how long to wait before retrying a response, or None to not retry.
+        
+        Args:
+            resource: "core" or "graphql"
+            response: Response of the last attempt
+            attempt: Number of the last attempt (0-based)
+            
+        Returns:
+            Seconds to wait, or None if the response should not be retried
+        """
+        if attempt >= self.max_retries:
+            return None
+        
+        status = response.status_code
+        headers = response.headers
+        retry_after = headers.get("Retry-After")
+        
+        # 403 is only retried when it is a (primary or secondary) rate limit;
+        # GraphQL reports an exhausted budget as a RATE_LIMITED error
+        rate_limited = (
+            status == 429
+            or (status == 403 and (retry_after or headers.get("X-RateLimit-Remaining") == "0"))
+            or (resource == "graphql" and status == 200 and b'"RATE_LIMITED"' in response.content)
+        )
+        if not rate_limited and status < 500:
+            return None
+        
+        if retry_after:
+            return float(retry_after)
+        
+        if rate_limited and headers.get("X-RateLimit-Remaining") == "0":
+            return max(0.0, int(headers.get("X-RateLimit-Reset", 0)) - time.time()) + 1
+        
+        backoff = min(self.max_backoff, self.base_backoff * 2 ** attempt)
+        return backoff * random.uniform(0.5, 1.5)
+    
+    def wait_retry(self, delay: float) -> None:
+        """Count a retry and wait before it."""
+        with self._lock:
+            self.retries += 1
+        self._sleep(delay)
+    
+    def stats(self) -> Dict:
+        """Return the known budgets and request counters."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "throttled_seconds": round(self.throttled_seconds, 3),
+                "budgets": {resource: dict(budget) for resource, budget in self.budgets.items()}
+            }
+
+
+class _Phase:
+    """Context manager adding its elapsed time to an Instrumentation phase."""
+    
+    __slots__ = ("instrumentation", "name", "start")
+    
+    def __init__(self, instrumentation: "Instrumentation", name: str):
+        self.instrumentation = instrumentation
+        self.name = name
+        self.start = 0.0
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.instrumentation.add_time(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class Instrumentation:
+    """Optional per-phase timings and counters for a StreakManager run.
+    
+    Phases ("plan", "write_file", "git_add", "git_commit", "fast_import",
+    "object_write", "push", "api_request") accumulate wall-clock time and call counts;
+    phases may nest, so times are inclusive. Counters track subprocesses,
+    bytes written, commits and API calls. When disabled, phase() returns a
+    shared no-op context manager and count() returns immediately.
+    """
+    
+    def __init__(self, enabled: bool = False):
+        """Initialize the instrumentation.
+        
+        Args:
+            enabled: Whether to record anything
+        """
+        self.enabled = enabled
+        self.phase_seconds = {}
+        self.phase_calls = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+    
+    def phase(self, name: str):
+        """Context manager timing a phase."""
+        if not self.enabled:
+            return _NO_PHASE
+        return _Phase(self, name)
+    
+    def add_time(self, name: str, seconds: float) -> None:
+        """Add one call of a phase with its duration."""
+        with self._lock:
+            self.phase_seconds[name] = self.phase_seconds.get(name, 0.0) + seconds
+            self.phase_calls[name] = self.phase_calls.get(name, 0) + 1
+    
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increase a counter."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+    
+    def summary(self) -> Dict:
+        """Return the recorded phases and counters."""
+        with self._lock:
+            return {
+                "wall_seconds": round(time.perf_counter() - self._started, 6),
+                "phases": {
+                    name: {"seconds": round(seconds, 6), "calls": self.phase_calls[name]}
+                    for name, seconds in sorted(self.phase_seconds.items())
+                },
+                "counters": dict(sorted(self.counters.items()))
+            }
+    
+    def merge(self, summary: Dict) -> None:
+        """Add the phases and counters of another summary, e.g. from a worker process."""
+        if not self.enabled:
+            return
+        with self._lock:
+            for name, phase in summary["phases"].items():
+                self.phase_seconds[name] = self.phase_seconds.get(name, 0.0) + phase["seconds"]
+                self.phase_calls[name] = self.phase_calls.get(name, 0) + phase["calls"]
+            for name, value in summary["counters"].items():
+                self.counters[name] = self.counters.get(name, 0) + value
+    
+    def to_prometheus(self, prefix: str = "streak_manager") -> str:
+        """Render the summary in the Prometheus text exposition format."""
+        summary = self.summary()
+        lines = [
+            f"# TYPE {prefix}_wall_seconds gauge",
+            f"{prefix}_wall_seconds {summary['wall_seconds']}",
+            f"# TYPE {prefix}_phase_seconds_total counter"
+        ]
+        for name, phase in summary["phases"].items():
+            lines.append(f'{prefix}_phase_seconds_total{{phase="{name}"}} {phase["seconds"]}')
+        lines.append(f"# TYPE {prefix}_phase_calls_total counter")
+        for name, phase in summary["phases"].items():
+            lines.append(f'{prefix}_phase_calls_total{{phase="{name}"}} {phase["calls"]}')
+        for name, value in summary["counters"].items():
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {value}")
+        return "\n".join(lines) + "\n"
+
+
+# Shared by every disabled Instrumentation; nullcontext can be re-entered
+_NO_PHASE = contextlib.nullcontext()
+
+
+class ContributionCalendar:
+    """Contribution counts for a continuous range of days, packed into an array.
+    
+    Day i of the calendar is the proleptic Gregorian ordinal start + i and
+    its count is counts[i], an unsigned 16-bit integer. Building the
+    calendar is one linear pass and the streaks take one more; nothing is
+    sorted and no per-day dictionaries or date strings are kept.
+    """
+    
+    __slots__ = ("start", "counts")
+    
+    MAX_COUNT = 0xFFFF
+    
+    def __init__(self, start: int, counts: array):
+        """Initialize the calendar.
+        
+        Args:
+            start: Ordinal of the first day
+            counts: Contribution count per day, array('H')
+        """
+        self.start = start
+        self.counts = counts
+    
+    @classmethod
+    def from_days(cls, contribution_days: List[Dict]) -> "ContributionCalendar":
+        """Build a calendar from {"date", "count"} dictionaries in any order.
+        
+        Days missing between the first and last date count as zero.
+        """
+        if not contribution_days:
+            return cls(datetime.date.today().toordinal(), array('H'))
+        
+        # Fast path for what the API returns: strictly ascending, gap-free days
+        dates = [day["date"] for day in contribution_days]
+        start = datetime.date.fromisoformat(dates[0]).toordinal()
+        end = datetime.date.fromisoformat(dates[-1]).toordinal()
+        if end - start == len(dates) - 1 and all(map(str.__lt__, dates, dates[1:])):
+            counts = [day["count"] for day in contribution_days]
+            if max(counts) > cls.MAX_COUNT:
+                counts = [min(count, cls.MAX_COUNT) for count in counts]
+            return cls(start, array('H', counts))
+        
+        ordinals = [datetime.date.fromisoformat(day["date"]).toordinal() for day in contribution_days]
+        start = min(ordinals)
+        counts = array('H', bytes(2 * (max(ordinals) - start + 1)))
+        
+        for ordinal, day in zip(ordinals, contribution_days):
+            counts[ordinal - start] = min(day["count"], cls.MAX_COUNT)
+        
+        return cls(start, counts)
+    
+    def __len__(self) -> int:
+        return len(self.counts)
+    
+    @property
+    def end(self) -> int:
+        """Ordinal of the last day."""
+        return self.start + len(self.counts) - 1
+    
+    def date(self, index: int) -> str:
+        """Date of a day index in YYYY-MM-DD format."""
+        return datetime.date.fromordinal(self.start + index).isoformat()
+    
+    def summary(self,
+                today: Optional[datetime.date] = None,
+                gap_days: int = 30,
+                windows: Tuple[int, ...] = (7, 30)) -> Dict:
+        """Compute streaks, recent gaps and rolling totals.
+        
+        Args:
+            today: Reference day for recent gaps, defaults to today
+            gap_days: Number of days up to today checked for gaps
+            windows: Sizes of the rolling windows ending at the last day
+            
+        Returns:
+            Dictionary with current_streak (run of active days ending at
+            the last day), longest_streak, gaps (days without contributions
+            in the last gap_days, newest first), rolling_totals
+            (window -> contributions), active_days and total_contributions
+        """
+        today = (today or datetime.date.today()).toordinal()
+        gap_start = today - gap_days + 1
+        counts = self.counts
+        
+        # Streaks: the run still open after the last day is the current streak
+        run = longest = 0
+        for count in counts:
+            if count:
+                run += 1
+                if run > longest:
+                    longest = run
+            else:
+                run = 0
+        
+        # Gap ordinals in ascending order: days before the calendar starts,
+        # zero days inside it, then days after it ends
+        gaps = list(range(gap_start, min(today, self.start - 1) + 1))
+        first = max(gap_start - self.start, 0)
+        last = min(today - self.start, len(counts) - 1)
+        gaps.extend(self.start + index for index in range(first, last + 1) if not counts[index])
+        gaps.extend(range(max(gap_start, self.end + 1), today + 1))
+        gaps.reverse()
+        
+        # array slices and sum() run in C
+        rolling = {window: sum(counts[-window:]) for window in windows}
+        active_days = len(counts) - counts.count(0)
+        total = sum(counts)
+        
+        return {
+            "current_streak": run,
+            "longest_streak": longest,
+            "gaps": [datetime.date.fromordinal(ordinal).isoformat() for ordinal in gaps],
+            "rolling_totals": rolling,
+            "active_days": active_days,
+            "total_contributions": total
+        }
+    
+    def to_days(self, newest_first: bool = True, limit: Optional[int] = None) -> List[Dict]:
+        """Expand the calendar back into {"date", "count"} dictionaries.
+        
+        Args:
+            newest_first: Order from the last day backwards
+            limit: Maximum number of days to return
+        """
+        indices = range(len(self.counts) - 1, -1, -1) if newest_first else range(len(self.counts))
+        if limit is not None:
+            indices = indices[:limit]
+        return [{"date": self.date(index), "count": self.counts[index]} for index in indices]
+
+
+class GapIndex:
+    """Days without contributions, stored as sorted run-length intervals.
+    
+    Built once from a ContributionCalendar. Every run of zero days becomes
+    one [start, end] interval of ordinals, with prefix sums of the interval
+    lengths, so range queries bisect instead of rescanning the calendar.
+    Days outside the calendar count as gaps, like days without data do in
+    ContributionCalendar.summary().
+    """
+    
+    __slots__ = ("first", "last", "starts", "ends", "prefix", "_longest")
+    
+    def __init__(self, first: int, last: int, starts: array, ends: array):
+        """Initialize the index.
+        
+        Args:
+            first: Ordinal of the first day with data
+            last: Ordinal of the last indexed day
+            starts: First ordinal of each gap interval, ascending
+            ends: Last ordinal of each gap interval
+        """
+        self.first = first
+        self.last = last
+        self.starts = starts
+        self.ends = ends
+        
+        # prefix[i] = number of gap days in the first i intervals
+        self.prefix = array('q', [0])
+        longest = None
+        for start, end in zip(starts, ends):
+            self.prefix.append(self.prefix[-1] + end - start + 1)
+            if longest is None or end - start > longest[1] - longest[0]:
+                longest = (start, end)
+        self._longest = longest
+    
+    @classmethod
+    def from_calendar(cls, calendar: ContributionCalendar, through: Optional[datetime.date] = None) -> "GapIndex":
+        """Build the index from a calendar.
+        
+        Args:
+            calendar: Contribution calendar
+            through: Last day to index, defaults to the later of today and
+                the calendar's last day; days after the calendar are gaps
+        """
+        last = max(calendar.end, (through or datetime.date.today()).toordinal())
+        starts = array('l')
+        ends = array('l')
+        
+        run_start = None
+        for index, count in enumerate(calendar.counts):
+            if not count:
+                if run_start is None:
+                    run_start = calendar.start + index
+            elif run_start is not None:
+                starts.append(run_start)
+                ends.append(calendar.start + index - 1)
+                run_start = None
+        
+        # A trailing run extends through the days without data
+        if run_start is None and last > calendar.end:
+            run_start = calendar.end + 1
+        if run_start is not None:
+            starts.append(run_start)
+            ends.append(last)
+        
+        return cls(calendar.start, last, starts, ends)
+    
+    def _gap_days_through(self, ordinal: int) -> int:
+        """Number of indexed gap days up to and including an ordinal."""
+        count = bisect.bisect_right(self.starts, ordinal)
+        if count == 0:
+            return 0
+        return self.prefix[count] - max(0, self.ends[count - 1] - ordinal)
+    
+    def count_between(self, start: datetime.date, end: datetime.date) -> int:
+        """Number of gap days between two dates, inclusive, in O(log n).
+        
+        Args:
+            start: First day of the range
+            end: Last day of the range
+        """
+        a, b = start.toordinal(), end.toordinal()
+        if a > b:
+            return 0
+        
+        # Days before the first day with data, or after the index, are gaps
+        outside = max(0, min(b, self.first - 1) - a + 1) + max(0, b - max(a, self.last + 1) + 1)
+        a, b = max(a, self.first), min(b, self.last)
+        if a > b:
+            return outside
+        return outside + self._gap_days_through(b) - self._gap_days_through(a - 1)
+    
+    def intervals_between(self, start: datetime.date, end: datetime.date) -> List[Tuple[datetime.date, datetime.date]]:
+        """Gap intervals overlapping a date range, clipped to it, oldest first.
+        
+        Finds the first overlapping interval by bisection, so the cost is
+        O(log n + k) for k returned intervals.
+        
+        Args:
+            start: First day of the range
+            end: Last day of the range
+        """
+        a, b = start.toordinal(), end.toordinal()
+        intervals = []
+        
+        if a < self.first:
+            intervals.append((a, min(b, self.first - 1)))
+        
+        i = bisect.bisect_left(self.ends, max(a, self.first))
+        while i < len(self.starts) and self.starts[i] <= b:
+            first, last = max(a, self.starts[i]), min(b, self.ends[i])
+            # Merge with the days before the calendar when the run starts on its first day
+            if intervals and intervals[-1][1] == first - 1:
+                intervals[-1] = (intervals[-1][0], last)
+            else:
+                intervals.append((first, last))
+            i += 1
+        
+        if b > self.last:
+            tail_start = max(a, self.last + 1)
+            # Merge with an interval that already runs up to the last day
+            if intervals and intervals[-1][1] == tail_start - 1:
+                intervals[-1] = (intervals[-1][0], b)
+            else:
+                intervals.append((tail_start, b))
+        
+        return [
+            (datetime.date.fromordinal(first), datetime.date.fromordinal(last))
+            for first, last in intervals if first <= last
+        ]
+    
+    def dates_between(self, start: datetime.date, end: datetime.date) -> List[str]:
+        """Gap dates between two dates in YYYY-MM-DD format, oldest first."""
+        dates = []
+        for first, last in self.intervals_between(start, end):
+            dates.extend(
+                datetime.date.fromordinal(ordinal).isoformat()
+                for ordinal in range(first.toordinal(), last.toordinal() + 1)
+            )
+        return dates
+    
+    def longest_gap(self) -> Optional[Tuple[datetime.date, datetime.date]]:
+        """First and last day of the longest indexed gap, or None without gaps."""
+        if self._longest is None:
+            return None
+        return datetime.date.fromordinal(self._longest[0]), datetime.date.fromordinal(self._longest[1])
+    
+    def count_per_month(self, start: datetime.date, end: datetime.date) -> Dict[str, int]:
+        """Number of gap days per month (YYYY-MM) between two dates.
+        
+        Each month is one count_between query, O(log n).
+        """
+        counts = {}
+        month_start = start
+        while month_start <= end:
+            next_month = (month_start.replace(day=1) + datetime.timedelta(days=32)).replace(day=1)
+            month_end = min(end, next_month - datetime.timedelta(days=1))
+            counts[month_start.strftime("%Y-%m")] = self.count_between(month_start, month_end)
+            month_start = next_month
+        return counts
 
-import requests
-from git import Repo, GitCommandError
 
 class StreakManager:
     """Main class for managing GitHub contribution streaks."""
@@ -30,6 +1453,13 @@ class StreakManager:
         self.config_path = config_path or os.path.expanduser("~/.github_streak_manager.ini")
         self.config = self._load_config()
         self.github_token = self.config.get('github', 'token', fallback=None)
+        self._session = None
+        self._async_executor = None
+        self.rate_limiter = RateLimiter()
+        self.cache = self._build_cache()
+        self.incremental_sync = self.config['preferences'].getboolean('incremental_sync', fallback=False)
+        self.content_engine = ContentEngine()
+        self.instrumentation = Instrumentation(self.config['preferences'].getboolean('instrumentation', fallback=False))
         
         if not self.github_token and not skip_token_check:
             print("No GitHub token found. Please set up your token first.")
@@ -50,6 +1480,41 @@ class StreakManager:
         
         return config
     
+    def _build_cache(self) -> Optional[DiskCache]:
+        """Create the API result cache from the [preferences] settings."""
+        preferences = self.config['preferences']
+        if not preferences.getboolean('cache_enabled', fallback=True):
+            return None
+        
+        default_dir = os.path.join(os.path.dirname(self.config_path), ".github_streak_manager_cache")
+        return DiskCache(
+            directory=os.path.expanduser(preferences.get('cache_dir', fallback=default_dir)),
+            ttl=preferences.getfloat('cache_ttl', fallback=3600),
+            max_entries=preferences.getint('cache_max_entries', fallback=256)
+        )
+    
+    @property
+    def session(self) -> requests.Session:
+        """Shared HTTP session for all GitHub API calls.
+        
+        Keeps TLS connections alive between requests and sets the auth
+        header once, so repeated API calls skip the handshake.
+        """
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+            session.mount("https://", adapter)
+            session.headers.update({
+                "Authorization": f"bearer {self.github_token}",
+                "User-Agent": "github-streak-manager"
+            })
+            self._session = session
+        
+        return self._session
+    
     def setup(self, token: str = None) -> None:
         """Set up the GitHub Streak Manager with necessary credentials.
         
@@ -61,6 +1526,7 @@ class StreakManager:
         
         self.github_token = token
         self.config['github']['token'] = token
+        self._session = None  # Rebuild the session with the new token
         
         with open(self.config_path, 'w') as f:
             self.config.write(f)
@@ -86,70 +1552,254 @@ class StreakManager:
         Returns:
             API response as dictionary
         """
+        return self._github_api_response(endpoint, method, data).json()
+    
+    def _github_api_response(self, endpoint: str, method: str = "GET", data: Dict = None,
+                             etag: Optional[str] = None) -> requests.Response:
+        """Make a GitHub API request and return the raw response.
+        
+        Args:
+            endpoint: API endpoint to request
+            method: HTTP method (GET, POST, etc.)
+            data: JSON data to send
+            etag: ETag of a cached response; a 304 response is returned as-is
+                when the resource did not change
+            
+        Returns:
+            Successful response, for access to headers such as Link
+        """
         base_url = "https://api.github.com"
         headers = {
-            "Authorization": f"token {self.github_token}",
             "Accept": "application/vnd.github.v3+json"
         }
         
+        if etag:
+            headers["If-None-Match"] = etag
+        
         url = f"{base_url}/{endpoint}"
         
         if method.upper() == "GET":
-            response = requests.get(url, headers=headers)
+            response = self._send_request("core", "GET", url, headers=headers)
         elif method.upper() == "POST":
-            response = requests.post(url, headers=headers, json=data)
+            response = self._send_request("core", "POST", url, headers=headers, json=data)
         else:
             raise ValueError(f"Unsupported HTTP method: {method}")
         
+        if response.status_code == 304 and etag:
+            return response
+        
         if response.status_code != 200:
             error_message = f"GitHub API Error: {response.status_code} - {response.text}"
-            raise Exception(error_message)
+            raise GitHubAPIError(error_message, response.status_code)
+        
+        return response
+    
+    def _send_request(self, resource: str, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request through the rate limiter, retrying transient failures.
+        
+        Args:
+            resource: Rate limit resource, "core" or "graphql"
+            method: HTTP method
+            url: Full request URL
+            kwargs: Passed on to requests
+            
+        Returns:
+            Response of the last attempt
+        """
+        attempt = 0
+        while True:
+            self.rate_limiter.before_request(resource)
+            with self.instrumentation.phase("api_request"):
+                response = self.session.request(method, url, **kwargs)
+            self.instrumentation.count(f"api_calls_{resource}")
+            self.rate_limiter.record(resource, response)
+            
+            delay = self.rate_limiter.retry_delay(resource, response, attempt)
+            if delay is None:
+                return response
+            
+            print(f"GitHub API returned {response.status_code}, retrying in {delay:.1f}s...", file=sys.stderr)
+            self.rate_limiter.wait_retry(delay)
+            attempt += 1
+    
+    def _cached_api_request(self, key: str, endpoint: str) -> Dict:
+        """GET an API endpoint through the cache, revalidating stale entries by ETag.
+        
+        Args:
+            key: Cache key for the result
+            endpoint: API endpoint to request
+            
+        Returns:
+            API response as dictionary
+        """
+        entry = self.cache.get(key) if self.cache else None
+        if entry and self.cache.is_fresh(entry):
+            return entry["data"]
         
-        return response.json()
+        response = self._github_api_response(endpoint, etag=entry.get("etag") if entry else None)
+        if response.status_code == 304:
+            self.cache.revalidated(key, entry)
+            return entry["data"]
+        
+        data = response.json()
+        if self.cache:
+            self.cache.put(key, data, response.headers.get("ETag"))
+        return data
+    
+    def _authenticated_login(self) -> str:
+        """Return the login of the authenticated user."""
+        # Key on a digest of the token so switching tokens never mixes users up
+        token_digest = hashlib.sha1(str(self.github_token).encode("utf-8")).hexdigest()[:16]
+        user_data = self._cached_api_request(f"user:{token_digest}", "user")
+        return user_data.get('login')
     
-    def _github_graphql_request(self, query: str, variables: Dict = None) -> Dict:
+    def _github_graphql_request(self, query: str, variables: Dict = None, allow_partial: bool = False) -> Dict:
         """Make a GitHub GraphQL API request.
         
         Args:
             query: GraphQL query string
             variables: Variables for the GraphQL query
+            allow_partial: Return the data of a response that also carries
+                errors (e.g. one unknown login in an aliased query)
             
         Returns:
             API response as dictionary
         """
         url = "https://api.github.com/graphql"
-        headers = {
-            "Authorization": f"bearer {self.github_token}",
-            "Content-Type": "application/json"
-        }
         
         data = {
             "query": query,
             "variables": variables or {}
         }
         
-        response = requests.post(url, headers=headers, json=data)
+        # json= sets the Content-Type header
+        response = self._send_request("graphql", "POST", url, json=data)
         
         if response.status_code != 200:
             error_message = f"GitHub GraphQL API Error: {response.status_code} - {response.text}"
-            raise Exception(error_message)
+            raise GitHubAPIError(error_message, response.status_code)
         
         result = response.json()
         
-        if "errors" in result:
+        if "errors" in result and not (allow_partial and result.get("data")):
             error_message = f"GraphQL Query Error: {result['errors']}"
-            raise Exception(error_message)
+            raise GitHubAPIError(error_message, response.status_code)
         
         return result["data"]
     
+    async def _run_async(self, func, *args):
+        """Run a blocking StreakManager call on the bounded async worker pool."""
+        if self._async_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            
+            # As many in-flight requests as the session keeps connections
+            self._async_executor = ThreadPoolExecutor(max_workers=HTTP_POOL_SIZE,
+                                                      thread_name_prefix="streak-async")
+        
+        import asyncio
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._async_executor, func, *args)
+    
+    async def _github_api_request_async(self, endpoint: str, method: str = "GET", data: Dict = None) -> Dict:
+        """Async variant of _github_api_request.
+        
+        Requests share the pooled session and run in worker threads, so many
+        calls can be in flight on one event loop.
+        """
+        return await self._run_async(self._github_api_request, endpoint, method, data)
+    
+    async def _github_graphql_request_async(self, query: str, variables: Dict = None,
+                                            allow_partial: bool = False) -> Dict:
+        """Async variant of _github_graphql_request."""
+        return await self._run_async(self._github_graphql_request, query, variables, allow_partial)
+    
+    async def get_user_repos_async(self, per_page: int = 100) -> List[Dict]:
+        """Async variant of get_user_repos, fetching the remaining pages concurrently.
+        
+        Args:
+            per_page: Repositories per page (GitHub allows at most 100)
+            
+        Returns:
+            List of repository information dictionaries
+        """
+        import asyncio
+        
+        endpoint = f"user/repos?per_page={per_page}"
+        first = await self._run_async(self._github_api_response, f"{endpoint}&page=1")
+        repos = first.json()
+        
+        pages = await asyncio.gather(*(
+            self._github_api_request_async(f"{endpoint}&page={page}")
+            for page in range(2, self._last_page(first) + 1)
+        ))
+        for page in pages:
+            repos.extend(page)
+        
+        return repos
+    
+    async def analyze_streak_async(self, username: Optional[str] = None, history: bool = False) -> Dict:
+        """Async variant of analyze_streak.
+        
+        Runs the same code as analyze_streak (cache, revalidation and
+        GraphQL) so results are identical; gather many of these to fan out
+        lookups on one event loop.
+        """
+        return await self._run_async(self.analyze_streak, username, history)
+    
     def get_user_repos(self) -> List[Dict]:
         """Get list of user's repositories.
         
         Returns:
             List of repository information dictionaries
         """
-        repos = self._github_api_request("user/repos?per_page=100")
-        return repos
+        return list(self.iter_user_repos())
+    
+    @staticmethod
+    def _last_page(response: requests.Response) -> int:
+        """Number of result pages, from the "last" link of a paginated response."""
+        last_url = response.links.get("last", {}).get("url")
+        if not last_url:
+            return 1
+        
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(last_url).query)
+        return int(query["page"][0])
+    
+    def iter_user_repos(self, per_page: int = 100, max_workers: int = API_MAX_WORKERS) -> Iterator[Dict]:
+        """Yield every repository of the user, across all result pages.
+        
+        The first page tells the page count through its Link header; the
+        remaining pages are then fetched concurrently and yielded in page
+        order as they become available.
+        
+        Args:
+            per_page: Repositories per page (GitHub allows at most 100)
+            max_workers: Maximum number of pages fetched at the same time
+            
+        Yields:
+            Repository information dictionaries
+        """
+        endpoint = f"user/repos?per_page={per_page}"
+        first = self._github_api_response(f"{endpoint}&page=1")
+        yield from first.json()
+        
+        last_page = self._last_page(first)
+        if last_page == 1:
+            return
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, last_page - 1)))
+        try:
+            futures = [
+                pool.submit(self._github_api_request, f"{endpoint}&page={page}")
+                for page in range(2, last_page + 1)
+            ]
+            for future in futures:
+                yield from future.result()
+        finally:
+            # Don't keep fetching if the caller stops early
+            pool.shutdown(wait=False, cancel_futures=True)
     
     def suggest_repos(self, language: Optional[str] = None) -> List[Dict]:
         """Suggest repositories for commit activity.
@@ -160,24 +1810,59 @@ class StreakManager:
         Returns:
             List of repository information dictionaries
         """
-        repos = self.get_user_repos()
+        repos = self.iter_user_repos()
         
-        # Filter by language if specified
+        # Filter by language if specified, while later pages are still arriving
         if language:
-            repos = [repo for repo in repos if repo.get('language') == language]
+            repos = (repo for repo in repos if repo.get('language') == language)
+        
+        repos = list(repos)
         
         # Sort by last updated (oldest first)
         repos.sort(key=lambda x: x.get('updated_at', ''))
         
         return repos
     
+    @contextlib.contextmanager
+    def open_repository(self, repo_path: str) -> Iterator[Repo]:
+        """Open and validate a repository once for a batch of operations.
+        
+        GitPython's Repo re-discovers the repository and re-reads its config
+        when constructed; batches open it here once and pass the handle on.
+        The handle's persistent git processes are closed on exit.
+        
+        Args:
+            repo_path: Path to local git repository
+            
+        Yields:
+            The opened repository
+            
+        Raises:
+            ValueError: If the path is not a git repository with a working tree
+        """
+        from git import Repo
+        from git.exc import InvalidGitRepositoryError, NoSuchPathError
+        
+        try:
+            repo = Repo(repo_path)
+        except (InvalidGitRepositoryError, NoSuchPathError) as e:
+            raise ValueError(f"Not a git repository: {repo_path}") from e
+        
+        try:
+            if repo.bare:
+                raise ValueError(f"Repository has no working tree: {repo_path}")
+            yield repo
+        finally:
+            repo.close()
+    
     def backdate_commit(self, 
                         repo_path: str, 
                         date: Union[str, datetime.datetime],
                         commit_message: Optional[str] = None,
                         file_content: Optional[str] = None,
                         file_path: Optional[str] = None,
-                        push: bool = False) -> bool:
+                        push: bool = False,
+                        repo: Optional[Repo] = None) -> bool:
         """Create a backdated commit in the specified repository.
         
         Args:
@@ -187,30 +1872,25 @@ class StreakManager:
             file_content: Content to write to the file
             file_path: Path to the file to modify
             push: Whether to push the commit to GitHub
+            repo: Already opened repository at repo_path, e.g. from
+                open_repository, so batches don't reopen it per commit
             
         Returns:
             True if commit was successful, False otherwise
         """
-        # Convert string date to datetime if needed
-        if isinstance(date, str):
-            date = datetime.datetime.strptime(date, "%Y-%m-%d")
-        
-        # Add random hour, minute, second for more natural commit times
-        if date.hour == 0 and date.minute == 0 and date.second == 0:
-            hour = random.randint(9, 19)  # Business hours
-            minute = random.randint(0, 59)
-            second = random.randint(0, 59)
-            date = date.replace(hour=hour, minute=minute, second=second)
+        date = self._randomize_commit_time(date)
         
         # Format date for Git
-        git_date = date.strftime("%Y-%m-%d %H:%M:%S")
+        git_date = date.strftime(GIT_DATE_FORMAT)
         
         # Generate commit message if not provided
         if not commit_message:
             commit_message = self._generate_commit_message()
         
         try:
-            repo = Repo(repo_path)
+            if repo is None:
+                from git import Repo
+                repo = Repo(repo_path)
             
             # Default file modification if none specified
             if not file_path:
@@ -233,127 +1913,476 @@ class StreakManager:
             os.makedirs(os.path.dirname(full_path), exist_ok=True)
             
             # Write the content to the file
-            with open(full_path, 'w') as f:
-                f.write(file_content)
+            with self.instrumentation.phase("write_file"):
+                with open(full_path, 'w') as f:
+                    f.write(file_content)
+            self.instrumentation.count("bytes_written", len(file_content.encode("utf-8")))
             
             # Stage the changes
-            repo.git.add(file_path)
+            with self.instrumentation.phase("git_add"):
+                repo.git.add(file_path)
             
             # Commit with backdated timestamp
             env = os.environ.copy()
             env["GIT_AUTHOR_DATE"] = git_date
             env["GIT_COMMITTER_DATE"] = git_date
             
-            repo.git.commit("-m", commit_message, env=env)
+            with self.instrumentation.phase("git_commit"):
+                repo.git.commit("-m", commit_message, env=env)
+            self.instrumentation.count("subprocesses", 2)
+            self.instrumentation.count("commits")
             
             # Push if requested
             if push:
-                repo.git.push()
+                with self.instrumentation.phase("push"):
+                    repo.git.push()
+                self.instrumentation.count("subprocesses")
+                self._expire_own_calendars()
+            
+            return True
+        
+        except Exception as e:
+            print(f"Error creating backdated commit: {e}")
+            return False
+    
+    def _randomize_commit_time(self, date: Union[str, datetime.datetime]) -> datetime.datetime:
+        """Turn a date into a commit timestamp with a natural time of day.
+        
+        Args:
+            date: Date in YYYY-MM-DD format or datetime object
+            
+        Returns:
+            Datetime with a random business-hours time if none was set
+        """
+        # Convert string date to datetime if needed
+        if isinstance(date, str):
+            date = datetime.datetime.strptime(date, "%Y-%m-%d")
+        
+        # Add random hour, minute, second for more natural commit times
+        if date.hour == 0 and date.minute == 0 and date.second == 0:
+            hour = random.randint(9, 19)  # Business hours
+            minute = random.randint(0, 59)
+            second = random.randint(0, 59)
+            date = date.replace(hour=hour, minute=minute, second=second)
+        
+        return date
+    
+    def _git(self, repo_path: str, *args: str, input: Optional[bytes] = None) -> str:
+        """Run a git command in the repository and return its stripped stdout.
+        
+        Args:
+            repo_path: Path to local git repository
+            args: Arguments passed to git
+            input: Optional bytes to feed to the command's stdin
+            
+        Returns:
+            Decoded standard output of the command
+        """
+        from git import GitCommandError
+        
+        self.instrumentation.count("subprocesses")
+        completed = subprocess.run(
+            ["git", "-C", repo_path, *args],
+            input=input,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=False
+        )
+        
+        if completed.returncode != 0:
+            error_message = completed.stderr.decode("utf-8", "replace").strip()
+            raise GitCommandError(["git", *args], completed.returncode, error_message)
+        
+        return completed.stdout.decode("utf-8", "replace").strip()
+    
+    def _commit_target(self, repo_path: str) -> Tuple[str, Optional[str], str, str]:
+        """Look up where and as whom commits written without `git commit` go.
+        
+        Args:
+            repo_path: Path to local git repository
+            
+        Returns:
+            (branch ref, SHA of HEAD or None for an unborn branch, author,
+            committer), the identities without their timestamp part
+        """
+        from git import GitCommandError
+        
+        branch = self._git(repo_path, "symbolic-ref", "-q", "HEAD")
+        try:
+            parent = self._git(repo_path, "rev-parse", "-q", "--verify", "HEAD")
+        except GitCommandError:
+            parent = None  # Unborn branch, first commit in the repository
+        
+        # Identity without the timestamp part ("Name <email> 1700000000 +0000")
+        author = self._git(repo_path, "var", "GIT_AUTHOR_IDENT").rsplit(" ", 2)[0]
+        committer = self._git(repo_path, "var", "GIT_COMMITTER_IDENT").rsplit(" ", 2)[0]
+        return branch, parent, author, committer
+    
+    def _fast_import_commits(self, repo_path: str, plan: CommitPlan) -> List[str]:
+        """Write a series of commits with a single `git fast-import` process.
+        
+        The commits are streamed on top of the checked-out branch and the
+        branch ref is updated once at the end, instead of spawning `git add`
+        and `git commit` per commit. Afterwards the generated paths are
+        checked out in one step so the index and working tree match HEAD;
+        any other uncommitted changes are left alone.
+        
+        Args:
+            repo_path: Path to local git repository
+            plan: Commit plan to write, in commit order
+            
+        Returns:
+            List of created commit SHAs, in commit order
+        """
+        if not plan.commits:
+            return []
+        
+        branch, parent, author, committer = self._commit_target(repo_path)
+        
+        def data_block(payload: bytes) -> bytes:
+            return b"data %d\n%s\n" % (len(payload), payload)
+        
+        # Each distinct content is sent once as a blob and referenced by its
+        # mark; commit marks are 1..n, blob marks follow
+        stream = bytearray()
+        blob_mark_base = len(plan.commits) + 1
+        for content_ref, content in enumerate(plan.contents):
+            stream += b"blob\nmark :%d\n" % (blob_mark_base + content_ref)
+            stream += data_block(content.encode("utf-8"))
+        
+        for mark, commit in enumerate(plan.commits, 1):
+            when = _raw_git_date(commit.timestamp)
+            stream += f"commit {branch}\nmark :{mark}\n".encode()
+            stream += f"author {author} {when}\ncommitter {committer} {when}\n".encode()
+            stream += data_block(commit.message.encode("utf-8"))
+            if mark == 1 and parent:
+                stream += f"from {parent}\n".encode()
+            stream += f"M 100644 :{blob_mark_base + commit.content_ref} {commit.path}\n".encode("utf-8")
+        stream += b"done\n"
+        
+        self.instrumentation.count("bytes_written", len(stream))
+        with tempfile.TemporaryDirectory() as tmp_dir, self.instrumentation.phase("fast_import"):
+            marks_path = os.path.join(tmp_dir, "marks")
+            self._git(
+                repo_path, "fast-import", "--quiet", "--done",
+                "--date-format=raw", f"--export-marks={marks_path}",
+                input=bytes(stream)
+            )
+            with open(marks_path) as f:
+                marks = dict(line.split() for line in f if line.strip())
+        self.instrumentation.count("commits", len(plan.commits))
+        
+        self._checkout_plan_paths(repo_path, plan)
+        return [marks[f":{mark}"] for mark in range(1, len(plan.commits) + 1)]
+    
+    def _object_db_commits(self, repo: Repo, plan: CommitPlan) -> List[str]:
+        """Write a series of commits straight into the object database.
+        
+        Blobs, trees and commits are stored as loose objects in-process
+        through gitdb, without a working tree, index or a git process per
+        commit. Only the
+        trees on the path of each generated file are rewritten; identical
+        contents are stored once. The branch ref is then advanced with a
+        single compare-and-swap `git update-ref`, and only the generated
+        paths are checked out.
+        
+        Args:
+            repo: Opened repository
+            plan: Commit plan to write, in commit order
+            
+        Returns:
+            List of created commit SHAs, in commit order
+        """
+        if not plan.commits:
+            return []
+        
+        from git.objects.fun import tree_entries_from_data
+        from gitdb import IStream, LooseObjectDB
+        
+        repo_path = repo.working_tree_dir
+        # Repo.odb.store runs `git hash-object` per object; write loose objects in-process
+        odb = LooseObjectDB(os.path.join(repo.common_dir, "objects"))
+        branch, parent, author, committer = self._commit_target(repo_path)
+        
+        def store(kind: bytes, data: bytes) -> bytes:
+            self.instrumentation.count("bytes_written", len(data))
+            return odb.store(IStream(kind, len(data), io.BytesIO(data))).binsha
+        
+        # Directory path -> {name: (mode, binsha)}, loaded on first use and
+        # updated in place, so every commit starts from the previous tree
+        trees = {}
+        
+        def tree_entries(directory: str, binsha: Optional[bytes]) -> Dict[str, Tuple[int, bytes]]:
+            if directory not in trees:
+                trees[directory] = {} if binsha is None else {
+                    name: (mode, sha) for sha, mode, name in tree_entries_from_data(repo.odb.stream(binsha).read())
+                }
+            return trees[directory]
+        
+        def store_tree(entries: Dict[str, Tuple[int, bytes]]) -> bytes:
+            # Git orders tree entries as if directory names ended with "/"
+            names = sorted(entries, key=lambda name: name + "/" if entries[name][0] == TREE_MODE else name)
+            return store(b"tree", b"".join(
+                b"%o %s\0%s" % (entries[name][0], name.encode("utf-8"), entries[name][1]) for name in names
+            ))
+        
+        base = parent
+        root_tree = repo.commit(parent).tree.binsha if parent else None
+        blobs = {}
+        shas = []
+        
+        with self.instrumentation.phase("object_write"):
+            for commit in plan.commits:
+                if commit.content_ref not in blobs:
+                    blobs[commit.content_ref] = store(b"blob", plan.content(commit).encode("utf-8"))
+                
+                # Walk down to the file's directory, then rewrite the trees back up
+                *directories, file_name = commit.path.split("/")
+                path = ""
+                chain = [tree_entries(path, root_tree)]
+                for name in directories:
+                    entry = chain[-1].get(name)
+                    path = f"{path}/{name}" if path else name
+                    chain.append(tree_entries(path, entry[1] if entry and entry[0] == TREE_MODE else None))
+                
+                chain[-1][file_name] = (BLOB_MODE, blobs[commit.content_ref])
+                for depth in range(len(directories), 0, -1):
+                    chain[depth - 1][directories[depth - 1]] = (TREE_MODE, store_tree(chain[depth]))
+                root_tree = store_tree(chain[0])
+                
+                when = _raw_git_date(commit.timestamp)
+                header = f"tree {root_tree.hex()}\n"
+                if parent:
+                    header += f"parent {parent}\n"
+                header += f"author {author} {when}\ncommitter {committer} {when}\n\n"
+                parent = store(b"commit", (header + commit.message + "\n").encode("utf-8")).hex()
+                shas.append(parent)
+        
+        # Compare-and-swap: fails if the branch moved while writing
+        self._git(repo_path, "update-ref", "-m", "github-streak-manager: backdated commits",
+                  branch, shas[-1], base or "0" * 40)
+        self.instrumentation.count("commits", len(shas))
+        
+        self._checkout_plan_paths(repo_path, plan)
+        return shas
+    
+    def _checkout_plan_paths(self, repo_path: str, plan: CommitPlan) -> None:
+        """Bring the generated paths of a plan into the index and working tree.
+        
+        After commits are written behind git's back, HEAD has files the
+        index lacks, which would show up as staged deletions. Only the
+        plan's paths are checked out; other uncommitted changes are kept.
+        """
+        paths = sorted({commit.path for commit in plan.commits})
+        self._git(
+            repo_path, "--literal-pathspecs", "checkout", "-q", "HEAD",
+            "--pathspec-from-file=-", "--pathspec-file-nul",
+            input="\0".join(paths).encode("utf-8")
+        )
+    
+    def _generate_commit_message(self, date_str=None, file_path=None, commit_index=0, total_commits=1) -> str:
+        """Generate a realistic commit message based on context.
+        
+        Args:
+            date_str: The date of the commit (for context)
+            file_path: Path to the file being modified
+            commit_index: Index of the current commit (0-based)
+            total_commits: Total number of commits for this date
+            
+        Returns:
+            A contextually appropriate commit message
+        """
+        return self.content_engine.message(file_path, commit_index, total_commits)
+    
+    def _get_contribution_days(self, username: str, history: bool = False, fresh: bool = False) -> List[Dict]:
+        """Get the contribution calendar of a user, served from the cache when possible.
+        
+        GraphQL has no conditional requests, so stale calendars are revalidated
+        against the user's event feed: a 304 there (which costs no rate limit)
+        means no new activity since the calendar was fetched. Only calendars
+        fetched today qualify, since the calendar window moves every day.
+        
+        With incremental_sync enabled the cached calendar acts as a local
+        store: only days from the last synced date onwards are fetched and
+        merged into it, and older days are kept.
+        
+        Args:
+            username: GitHub username
+            history: Fetch every contribution year instead of the last year
+            fresh: Fetch the calendar even if the cached one is fresh, for
+                callers that write commits based on it
+            
+        Returns:
+            List of {"date": YYYY-MM-DD, "count": int} dictionaries, oldest first
+        """
+        if history:
+            mode = "history"
+        else:
+            mode = "incremental" if self.incremental_sync else "default"
+        key = f"calendar:{username.lower()}:{mode}"
+        entry = self.cache.get(key) if self.cache else None
+        if entry and not fresh and self.cache.is_fresh(entry):
+            return entry["data"]
+        
+        etag = None
+        if self.cache and not fresh:
+            fetched_today = bool(entry) and datetime.date.fromtimestamp(entry["fetched_at"]) == datetime.date.today()
+            try:
+                response = self._github_api_response(
+                    f"users/{username}/events?per_page=1",
+                    etag=entry.get("etag") if fetched_today else None
+                )
+                if response.status_code == 304:
+                    self.cache.revalidated(key, entry)
+                    return entry["data"]
+                etag = response.headers.get("ETag")
+            except Exception as e:
+                # Revalidation is best effort, fall back to a full fetch
+                print(f"Could not check recent activity of {username}: {e}", file=sys.stderr)
+        
+        if self.incremental_sync and entry and entry["data"]:
+            stored_days = entry["data"]
+            if fresh:
+                # Backdated commits may have filled any day of the last year, sync all of it again
+                cutoff = (datetime.date.today() - datetime.timedelta(days=365)).isoformat()
+                stored_days = [day for day in stored_days if day["date"] <= cutoff] or stored_days[:1]
+            contribution_days = self._sync_contribution_days(username, stored_days)
+        elif history:
+            contribution_days = self._fetch_contribution_history(username)
+        else:
+            contribution_days = self._fetch_contribution_days(username)
+        
+        if self.cache:
+            self.cache.put(key, contribution_days, etag)
+        
+        return contribution_days
+    
+    def _fetch_contribution_history(self, username: str) -> List[Dict]:
+        """Fetch the complete contribution history of a user.
+        
+        The account's contribution years are looked up first, then every year
+        window is fetched concurrently and the windows are stitched into one
+        continuous calendar. Years without contributions are filled with zero
+        days so streaks never span them.
+        
+        Args:
+            username: GitHub username
             
-            return True
+        Returns:
+            List of {"date": YYYY-MM-DD, "count": int} dictionaries, oldest first
+        """
+        query = """
+        query($username: String!) {
+          user(login: $username) {
+            contributionsCollection {
+              contributionYears
+            }
+          }
+        }
+        """
+        data = self._github_graphql_request(query, {"username": username})
+        years = sorted(data["user"]["contributionsCollection"]["contributionYears"])
+        if not years:
+            return []
         
-        except Exception as e:
-            print(f"Error creating backdated commit: {e}")
-            return False
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None, microsecond=0)
+        windows = [
+            (year, datetime.datetime(year, 1, 1), min(datetime.datetime(year, 12, 31, 23, 59, 59), now))
+            for year in years
+        ]
+        
+        def fetch_year(window: Tuple[int, datetime.datetime, datetime.datetime]) -> List[Dict]:
+            year, from_date, to_date = window
+            days = self._fetch_contribution_days(username, from_date, to_date)
+            # Calendar weeks may start in the previous year, keep the year's own days
+            return [day for day in days if day["date"].startswith(f"{year}-")]
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        counts = {}
+        with ThreadPoolExecutor(max_workers=min(API_MAX_WORKERS, len(windows))) as pool:
+            for days in pool.map(fetch_year, windows):
+                for day in days:
+                    counts[day["date"]] = day["count"]
+        
+        if not counts:
+            return []
+        
+        # Stitch the windows into one continuous calendar
+        current = datetime.date.fromisoformat(min(counts))
+        last = datetime.date.fromisoformat(max(counts))
+        contribution_days = []
+        while current <= last:
+            date_str = current.isoformat()
+            contribution_days.append({"date": date_str, "count": counts.get(date_str, 0)})
+            current += datetime.timedelta(days=1)
+        
+        return contribution_days
     
-    def _generate_commit_message(self, date_str=None, file_path=None, commit_index=0, total_commits=1) -> str:
-        """Generate a realistic commit message based on context.
+    def _sync_contribution_days(self, username: str, stored_days: List[Dict]) -> List[Dict]:
+        """Fetch only the days since the last synced date and merge them into stored days.
         
         Args:
-            date_str: The date of the commit (for context)
-            file_path: Path to the file being modified
-            commit_index: Index of the current commit (0-based)
-            total_commits: Total number of commits for this date
+            username: GitHub username
+            stored_days: Previously synced days, oldest first
             
         Returns:
-            A contextually appropriate commit message
+            Merged list of {"date": YYYY-MM-DD, "count": int} dictionaries, oldest first
         """
-        # For first commits in a repository
-        if commit_index == 0 and total_commits > 1:
-            initial_messages = [
-                "Initial commit",
-                "Initialize project structure",
-                "Setup project boilerplate",
-                "First commit",
-                "Create basic project structure",
-                "Start new project",
-                "Set up repository"
-            ]
-            return random.choice(initial_messages)
+        # Re-fetch the last synced day too, it may have been synced mid-day
+        window_start = datetime.datetime.strptime(stored_days[-1]["date"], "%Y-%m-%d")
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None, microsecond=0)
         
-        # For documentation updates
-        if file_path and ("README" in file_path or "docs/" in file_path or ".md" in file_path):
-            doc_messages = [
-                "Update documentation",
-                "Improve README clarity",
-                "Add installation instructions",
-                "Update usage examples",
-                "Fix typo in documentation",
-                "Add section on advanced usage",
-                "Document new feature",
-                "Update API documentation",
-                "Add contributing guidelines",
-                "Update changelog"
-            ]
-            return random.choice(doc_messages)
+        days_by_date = {day["date"]: day for day in stored_days}
         
-        # For final commits in a series
-        if commit_index == total_commits - 1 and total_commits > 1:
-            final_messages = [
-                "Final adjustments",
-                "Clean up code before pushing",
-                "Fix minor issues",
-                "Apply code review feedback",
-                "Prepare for deployment",
-                "Ready for release",
-                "Final tweaks before merge"
-            ]
-            return random.choice(final_messages)
+        # A contributionsCollection window may span at most one year
+        while window_start <= now:
+            window_end = min(window_start + datetime.timedelta(days=365), now)
+            for day in self._fetch_contribution_days(username, window_start, window_end):
+                days_by_date[day["date"]] = day
+            window_start = window_end + datetime.timedelta(seconds=1)
         
-        # General coding messages
-        code_messages = [
-            "Update functionality",
-            "Refactor code for better readability",
-            "Optimize performance",
-            "Fix bug in error handling",
-            "Improve code structure",
-            "Add new feature",
-            "Fix edge case",
-            "Implement requested changes",
-            "Clean up code formatting",
-            "Improve error messages",
-            "Add better comments",
-            "Refactor utility functions",
-            "Remove deprecated code",
-            "Add unit tests",
-            "Fix linting issues",
-            "Improve logging",
-            "Update dependencies",
-            "Add error handling",
-            "Implement feedback from code review",
-            "Fix security vulnerability",
-            "Update API endpoint",
-            "Add new helper method",
-            "Make code more maintainable",
-            "Simplify complex logic",
-            "Fix regression"
-        ]
-        return random.choice(code_messages)
+        return [days_by_date[date] for date in sorted(days_by_date)]
     
-    def analyze_streak(self, username: Optional[str] = None) -> Dict:
-        """Analyze current GitHub streak status using GraphQL API.
+    def _fetch_contribution_days(self,
+                                 username: str,
+                                 from_date: Optional[datetime.datetime] = None,
+                                 to_date: Optional[datetime.datetime] = None) -> List[Dict]:
+        """Fetch contribution data using GraphQL.
         
         Args:
-            username: GitHub username (uses authenticated user if None)
+            username: GitHub username
+            from_date: Start of the window (UTC), None for GitHub's default last year
+            to_date: End of the window (UTC), required with from_date
             
         Returns:
-            Dictionary with streak information
+            List of {"date": YYYY-MM-DD, "count": int} dictionaries, oldest first
         """
-        if not username:
-            user_data = self._github_api_request("user")
-            username = user_data.get('login')
+        if from_date is not None:
+            query = """
+            query($username: String!, $from: DateTime!, $to: DateTime!) {
+              user(login: $username) {
+                contributionsCollection(from: $from, to: $to) {
+                  contributionCalendar {
+                    weeks {
+                      contributionDays {
+                        date
+                        contributionCount
+                      }
+                    }
+                  }
+                }
+              }
+            }
+            """
+            variables = {
+                "username": username,
+                "from": from_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "to": to_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+            }
+            data = self._github_graphql_request(query, variables)
+            return self._flatten_contribution_calendar(data["user"]["contributionsCollection"])
         
-        # Get the last year of contribution data using GraphQL
         query = """
         query($username: String!) {
           user(login: $username) {
@@ -373,9 +2402,19 @@ class StreakManager:
         
         variables = {"username": username}
         data = self._github_graphql_request(query, variables)
+        return self._flatten_contribution_calendar(data["user"]["contributionsCollection"])
+    
+    def _flatten_contribution_calendar(self, contributions_collection: Dict) -> List[Dict]:
+        """Turn a GraphQL contributionsCollection into a flat list of days.
         
+        Args:
+            contributions_collection: The contributionsCollection object of a response
+            
+        Returns:
+            List of {"date": YYYY-MM-DD, "count": int} dictionaries, oldest first
+        """
         # Process contribution data
-        weeks = data["user"]["contributionsCollection"]["contributionCalendar"]["weeks"]
+        weeks = contributions_collection["contributionCalendar"]["weeks"]
         contribution_days = []
         
         for week in weeks:
@@ -385,61 +2424,158 @@ class StreakManager:
                     "count": day["contributionCount"]
                 })
         
-        # Sort by date (newest first)
-        contribution_days.sort(key=lambda x: x["date"], reverse=True)
+        return contribution_days
+    
+    def analyze_streak(self, username: Optional[str] = None, history: bool = False) -> Dict:
+        """Analyze current GitHub streak status using GraphQL API.
         
-        # Calculate current streak
-        current_streak = 0
-        for day in contribution_days:
-            if day["count"] > 0:
-                current_streak += 1
-            else:
-                break
-        
-        # Calculate longest streak
-        longest_streak = 0
-        current_longest = 0
-        for day in sorted(contribution_days, key=lambda x: x["date"]):
-            if day["count"] > 0:
-                current_longest += 1
-            else:
-                longest_streak = max(longest_streak, current_longest)
-                current_longest = 0
+        Args:
+            username: GitHub username (uses authenticated user if None)
+            history: Analyze the complete contribution history instead of the
+                last year, so the longest streak is all-time
+            
+        Returns:
+            Dictionary with streak information
+        """
+        if not username:
+            username = self._authenticated_login()
         
-        longest_streak = max(longest_streak, current_longest)
+        contribution_days = list(self._get_contribution_days(username, history))
+        return self._streak_info(contribution_days)
+    
+    def gap_index(self, username: Optional[str] = None, history: bool = False, fresh: bool = False) -> GapIndex:
+        """Build a gap index over a user's contribution calendar.
         
-        # Find missing dates (days with no contributions in the last 30 days)
-        today = datetime.date.today()
-        last_30_days = [
-            (today - datetime.timedelta(days=i)).isoformat() 
-            for i in range(30)
-        ]
+        Args:
+            username: GitHub username (uses authenticated user if None)
+            history: Index the complete contribution history instead of the
+                last year
+            fresh: Bypass a fresh cached calendar, see _get_contribution_days
+            
+        Returns:
+            GapIndex through today
+        """
+        if not username:
+            username = self._authenticated_login()
+        
+        calendar = ContributionCalendar.from_days(self._get_contribution_days(username, history, fresh))
+        return GapIndex.from_calendar(calendar)
+    
+    def iter_contribution_calendars(self, usernames: List[str],
+                                    history: bool = False) -> Iterator[Tuple[str, ContributionCalendar]]:
+        """Fetch contribution calendars one user at a time.
+        
+        Only one calendar is held at a time, so exports of many users keep
+        a flat memory profile. Unknown users are reported and skipped.
+        
+        Args:
+            usernames: GitHub usernames
+            history: Fetch every contribution year instead of the last year
+            
+        Yields:
+            (username, calendar) pairs in the given order
+        """
+        for username in dict.fromkeys(usernames):  # Deduplicate, keep order
+            try:
+                contribution_days = self._get_contribution_days(username, history)
+            except GitHubAPIError as e:
+                print(f"Skipping {username}: {e}", file=sys.stderr)
+                continue
+            yield username, ContributionCalendar.from_days(contribution_days)
+    
+    def analyze_streaks(self, usernames: List[str], chunk_size: int = GRAPHQL_USERS_PER_QUERY) -> Dict[str, Dict]:
+        """Analyze the streaks of many users with a few aliased GraphQL queries.
+        
+        Users are packed into one GraphQL document per chunk, one aliased
+        `user(login:)` field each, instead of one request per user. Calendars
+        still fresh in the cache are not requested again.
+        
+        Args:
+            usernames: GitHub usernames
+            chunk_size: Maximum number of users per GraphQL document
+            
+        Returns:
+            Dictionary mapping each username to the same dictionary
+            analyze_streak returns; unknown users are left out
+        """
+        calendars = {}
+        pending = []
+        
+        for username in dict.fromkeys(usernames):  # Deduplicate, keep order
+            entry = self.cache.get(f"calendar:{username.lower()}:default") if self.cache else None
+            if entry and self.cache.is_fresh(entry):
+                calendars[username] = entry["data"]
+            else:
+                pending.append(username)
+        
+        for start in range(0, len(pending), chunk_size):
+            chunk = pending[start:start + chunk_size]
+            
+            params = ", ".join(f"$u{i}: String!" for i in range(len(chunk)))
+            fields = "\n".join(
+                f"u{i}: user(login: $u{i}) {{ contributionsCollection {{ {CONTRIBUTION_CALENDAR_FIELDS} }} }}"
+                for i in range(len(chunk))
+            )
+            query = f"query({params}) {{\n{fields}\n}}"
+            variables = {f"u{i}": username for i, username in enumerate(chunk)}
+            
+            data = self._github_graphql_request(query, variables, allow_partial=True)
+            
+            for i, username in enumerate(chunk):
+                user = data.get(f"u{i}")
+                if not user:
+                    print(f"Could not resolve GitHub user: {username}")
+                    continue
+                
+                contribution_days = self._flatten_contribution_calendar(user["contributionsCollection"])
+                calendars[username] = contribution_days
+                if self.cache:
+                    self.cache.put(f"calendar:{username.lower()}:default", contribution_days)
         
-        recent_contribution_dates = {
-            day["date"] for day in contribution_days[:30]
+        return {
+            username: self._streak_info(list(calendars[username]))
+            for username in dict.fromkeys(usernames) if username in calendars
         }
+    
+    def _streak_info(self, contribution_days: List[Dict]) -> Dict:
+        """Compute streak statistics from a contribution calendar.
         
-        missing_dates = [
-            date for date in last_30_days 
-            if date not in recent_contribution_dates
-        ]
+        Args:
+            contribution_days: List of {"date", "count"} dictionaries
+            
+        Returns:
+            Dictionary with streak information
+        """
+        calendar = ContributionCalendar.from_days(contribution_days)
+        summary = calendar.summary()
+        
+        # Last 90 days, newest first
+        recent_days = calendar.to_days(newest_first=True, limit=90)
         
         # Get last commit date
-        last_commit_date = contribution_days[0]["date"] if contribution_days and contribution_days[0]["count"] > 0 else None
+        last_commit_date = recent_days[0]["date"] if recent_days and recent_days[0]["count"] > 0 else None
         
         return {
-            "current_streak": current_streak,
-            "longest_streak": longest_streak,
-            "missing_dates": missing_dates,
+            "current_streak": summary["current_streak"],
+            "longest_streak": summary["longest_streak"],
+            "missing_dates": summary["gaps"],
             "last_commit_date": last_commit_date,
-            "contribution_days": contribution_days[:90]  # Last 90 days
+            "contributions_last_7_days": summary["rolling_totals"][7],
+            "contributions_last_30_days": summary["rolling_totals"][30],
+            "contribution_days": recent_days
         }
     
     def bulk_backdate(self, 
                       repo_path: str,
                       dates: List[str],
                       commit_count: int = 1,
-                      push: bool = False) -> Dict[str, bool]:
+                      push: bool = False,
+                      backend: str = "commit",
+                      pacing: Optional[PacingPolicy] = None,
+                      seed: Optional[int] = None,
+                      push_strategy: str = "end",
+                      push_every: int = 10,
+                      resume: bool = False) -> Dict[str, bool]:
         """Create multiple backdated commits.
         
         Args:
@@ -447,210 +2583,539 @@ class StreakManager:
             dates: List of dates in YYYY-MM-DD format
             commit_count: Number of commits per date (or max if randomized)
             push: Whether to push the commits to GitHub
+            backend: "commit" for one git commit per call, "fast-import"
+                to write the whole series with a single git fast-import, or
+                "objects" to write it directly into the object database
+            pacing: Delay/rate-limit policy, defaults to no delay
+            seed: Seed for reproducible commit counts
+            push_strategy: When to push, see execute_plan
+            push_every: Number of dates per push for the "every-n" strategy
+            resume: Continue the interrupted run in repo_path, see execute_plan
             
         Returns:
             Dictionary mapping dates to success status
         """
-        results = {}
-        
-        # Get weekdays for each date to make patterns more realistic
-        date_info = {}
-        for date_str in dates:
-            dt = datetime.datetime.strptime(date_str, "%Y-%m-%d")
-            is_weekend = dt.weekday() >= 5  # 5 = Saturday, 6 = Sunday
-            day_of_week = dt.weekday()
-            
-            # Randomize commit count based on weekday/weekend for more realistic patterns
-            # Weekends typically have fewer commits
-            if commit_count == 1:
-                # Default behavior, 1 commit
-                actual_commit_count = 1
-            else:
-                # More realistic pattern: more commits on weekdays (especially midweek), fewer on weekends
-                if is_weekend:
-                    # Weekend: 0-2 commits usually
-                    actual_commit_count = random.choices(
-                        [0, 1, 2], 
-                        weights=[30, 60, 10],  # 30% chance of 0, 60% chance of 1, 10% chance of 2
-                        k=1
-                    )[0]
-                else:
-                    # Weekday: Distribution based on day of week
-                    # Monday/Friday: 1-3 commits typically
-                    # Tuesday-Thursday: 1-5 commits typically
-                    if day_of_week in [0, 4]:  # Monday or Friday
-                        max_count = min(3, commit_count)
-                        weights = [0, 40, 40, 20]  # 0, 1, 2, 3 commits
-                    else:  # Tuesday, Wednesday, Thursday
-                        max_count = min(5, commit_count)
-                        weights = [0, 20, 30, 30, 15, 5]  # 0, 1, 2, 3, 4, 5 commits
-                    
-                    # Adjust weights array to match the max count
-                    weights = weights[:max_count+1]
-                    # Ensure weights sum to 100
-                    total = sum(weights)
-                    weights = [w * 100 / total for w in weights]
-                    
-                    # Ensure the population and weights arrays match in length
-                    population = list(range(max_count + 1))
-                    if len(population) != len(weights):
-                        # Trim or extend weights to match population length
-                        if len(weights) > len(population):
-                            weights = weights[:len(population)]
-                        else:
-                            weights.extend([1] * (len(population) - len(weights)))
-                        # Normalize weights again
-                        total = sum(weights)
-                        weights = [w * 100 / total for w in weights]
-                    
-                    actual_commit_count = random.choices(
-                        population,
-                        weights=weights,
-                        k=1
-                    )[0]
-            
-            date_info[date_str] = {
-                'weekday': day_of_week,
-                'is_weekend': is_weekend,
-                'commit_count': actual_commit_count
-            }
+        run = _planner_run("bulk", dates=dates, commit_count=commit_count, seed=seed)
+        plan = self.resumable_plan(repo_path, run) if resume else None
+        if plan is None:
+            with self.instrumentation.phase("plan"):
+                plan = self.plan_bulk_backdate(dates, commit_count, seed)
+        return self.execute_plan(repo_path, plan, push=push, backend=backend, pacing=pacing,
+                                 push_strategy=push_strategy, push_every=push_every, resume=resume, run=run)
+    
+    def plan_bulk_backdate(self, dates: List[str], commit_count: int = 1, seed: Optional[int] = None) -> CommitPlan:
+        """Plan the commits for bulk_backdate without touching any repository.
         
-        for date_str in dates:
-            success = False
-            actual_commit_count = date_info[date_str]['commit_count']
+        Args:
+            dates: List of dates in YYYY-MM-DD format
+            commit_count: Number of commits per date (or max if randomized)
+            seed: Seed for reproducible commit counts
             
-            # Skip dates with 0 commits (for natural pattern)
-            if actual_commit_count == 0:
-                print(f"Skipping {date_str} (no commits scheduled)")
-                results[date_str] = True
+        Returns:
+            Commit plan covering every date, including dates without commits
+        """
+        # Randomize commit count based on weekday/weekend for more realistic patterns
+        # Weekends typically have fewer commits
+        if commit_count == 1:
+            # Default behavior, 1 commit
+            weekday_weights = [[0, 1]] * 7
+        else:
+            # More realistic pattern: more commits on weekdays (especially midweek), fewer on weekends
+            # Weekend: 0-2 commits usually (30% chance of 0, 60% chance of 1, 10% chance of 2)
+            weekend = [30, 60, 10]
+            # Monday/Friday: 1-3 commits typically
+            mon_fri = CommitCountSampler.truncated_table(min(3, commit_count), [0, 40, 40, 20])
+            # Tuesday-Thursday: 1-5 commits typically
+            midweek = CommitCountSampler.truncated_table(min(5, commit_count), [0, 20, 30, 30, 15, 5])
+            weekday_weights = [mon_fri, midweek, midweek, midweek, mon_fri, weekend, weekend]
+        
+        counts = CommitCountSampler(weekday_weights, seed).sample(dates)
+        
+        plan = CommitPlan(dates)
+        self._plan_commits(plan, zip(dates, counts))
+        
+        return plan
+    
+    def _plan_commits(self, plan: CommitPlan, commit_counts: Iterator[Tuple[str, int]]) -> None:
+        """Add the commits for many dates to a plan.
+        
+        Files, times and messages are picked date by date; the contents of
+        the whole batch are then rendered at once by the content engine.
+        
+        Args:
+            plan: Plan to extend
+            commit_counts: (date in YYYY-MM-DD format, number of commits) pairs
+        """
+        file_types = ContentEngine.FILE_TYPES
+        pending = []
+        
+        for date_str, commit_count in commit_counts:
+            if commit_count == 0:
                 continue
             
-            print(f"Creating {actual_commit_count} commits for {date_str}")
-            
-            # Different file types for variety
-            file_types = [
-                "docs/updates.md",
-                "src/main.py",
-                "utils/helpers.py",
-                "config/settings.json",
-                "README.md",
-                "tests/test_main.py",
-                "data/sample.json"
-            ]
-            
             # Choose random subset of files to modify for this date
-            daily_files = random.sample(file_types, min(actual_commit_count, len(file_types)))
-            if actual_commit_count > len(daily_files):
+            daily_files = random.sample(file_types, min(commit_count, len(file_types)))
+            if commit_count > len(daily_files):
                 # Add repeats if needed
-                daily_files.extend(random.sample(file_types, actual_commit_count - len(daily_files)))
+                daily_files.extend(random.sample(file_types, commit_count - len(daily_files)))
             
-            for i in range(actual_commit_count):
-                # Pick a file to modify
-                file_type = daily_files[i]
-                file_path = f"streak_updates/{date_str}/{file_type}"
+            # Random times of day, in order so history stays chronological
+            timestamps = sorted(self._randomize_commit_time(date_str) for _ in range(commit_count))
+            
+            for i in range(commit_count):
+                file_path = f"streak_updates/{date_str}/{daily_files[i]}"
                 
-                # Create content based on file type
-                if file_path.endswith('.md'):
-                    content = f"# Update for {date_str}\n\nDocumentation update #{i+1}.\n\n## Changes\n\n- Updated documentation\n- Improved examples\n- Fixed typos"
-                elif file_path.endswith('.py'):
-                    content = f'''"""
-Module updated on {date_str}
-"""
-
-def sample_function_{date_str.replace("-", "")}_{i}():
-    """Example function added in update #{i+1}."""
-    print("Sample function implementation")
-    return True
-
-# Added in update #{i+1}
-class SampleClass:
-    """Example class for demonstration."""
-    
-    def __init__(self):
-        """Initialize the class."""
-        self.value = "{date_str}"
+                # Generate appropriate commit message for context
+                commit_message = self.content_engine.message(file_path, i, commit_count)
+                pending.append((date_str, timestamps[i].strftime(GIT_DATE_FORMAT), file_path, commit_message, i, commit_count))
+        
+        contents = self.content_engine.render_batch([
+            (file_path, date_str, i, commit_count)
+            for date_str, _, file_path, _, i, commit_count in pending
+        ])
+        for (date_str, timestamp, file_path, commit_message, _, _), content in zip(pending, contents):
+            plan.add_commit(
+                date=date_str,
+                timestamp=timestamp,
+                path=file_path,
+                message=commit_message,
+                content=content
+            )
     
-    def get_value(self):
-        """Return the stored value."""
-        return self.value
-'''
-                elif file_path.endswith('.json'):
-                    content = f'''{{
-  "update_date": "{date_str}",
-  "update_number": {i+1},
-  "changes": [
-    "Updated configuration",
-    "Modified settings",
-    "Adjusted parameters"
-  ]
-}}'''
-                else:
-                    content = f"# Update for {date_str}\n\nCommit #{i+1} of {actual_commit_count}\n\nGenerated content for file type: {file_path.split('.')[-1]}"
+    def execute_plan(self,
+                     repo_path: str,
+                     plan: CommitPlan,
+                     push: bool = False,
+                     backend: str = "commit",
+                     pacing: Optional[PacingPolicy] = None,
+                     push_strategy: str = "end",
+                     push_every: int = 10,
+                     resume: bool = False,
+                     run: Optional[Dict] = None) -> Dict[str, bool]:
+        """Create the commits of a plan in a repository.
+        
+        Progress is written ahead to a CheckpointJournal in the repository's
+        git directory, replacing the journal of the previous run unless
+        resume is set. The run stops at the first commit that fails, so the
+        journal always holds the commits of a prefix of the plan.
+        
+        Args:
+            repo_path: Path to local git repository
+            plan: Commit plan to execute
+            push: Whether to push the commits to GitHub
+            backend: "commit" for one git commit per call, "fast-import"
+                to write the whole series with a single git fast-import, or
+                "objects" to write it directly into the object database
+            pacing: Delay/rate-limit policy, defaults to no delay
+            push_strategy: "end" to push once after all commits, "per-date" to
+                push after every date, or "every-n" to push every push_every dates
+            push_every: Number of dates per push for the "every-n" strategy
+            resume: Continue the run recorded in the repository's checkpoint
+                journal, skipping its written commits; the journal's plan
+                replaces plan
+            run: Planner and options that produced plan, which must match
+                the journal's when resuming, see CheckpointJournal.run_description;
+                defaults to the plan's contents
+            
+        Returns:
+            Dictionary mapping dates to success status
+            
+        Raises:
+            ValueError: For invalid options, if repo_path is not a git
+                repository with a working tree, or if the journal cannot be
+                resumed
+        """
+        if backend not in COMMIT_BACKENDS:
+            raise ValueError(f"Unsupported commit backend: {backend}")
+        if push_strategy not in PUSH_STRATEGIES:
+            raise ValueError(f"Unsupported push strategy: {push_strategy}")
+        if push_every < 1:
+            raise ValueError("push_every must be at least 1")
+        
+        pacing = pacing or PacingPolicy()
+        results = {}
+        
+        # Dates whose commits are not on the remote yet, and failed pushes
+        unpushed_dates = []
+        push_failures = []
+        dates_per_push = 1 if push_strategy == "per-date" else push_every
+        
+        with self.open_repository(repo_path) as repo:
+            journal = CheckpointJournal(os.path.join(repo.git_dir, JOURNAL_FILE_NAME))
+            try:
+                plan = self._start_journal(repo, journal, plan, resume, run)
+                done = journal.completed
+                commits_by_date = plan.commits_by_date()
                 
-                # Generate appropriate commit message for context
-                commit_message = self._generate_commit_message(
-                    date_str=date_str,
-                    file_path=file_path,
-                    commit_index=i,
-                    total_commits=actual_commit_count
-                )
+                # Commits of the interrupted run that never reached the remote
+                if push and done and journal.pushed != journal.head:
+                    unpushed_dates = list(dict.fromkeys(commit.date for commit in plan.commits[:done]))
                 
-                # Add variable delay between commits for more natural behavior
-                if i > 0:
-                    # More natural pause between commits (people typically don't commit every few seconds)
-                    time.sleep(random.uniform(1.0, 5.0))
+                # Plan index of the first commit of the current date
+                index = 0
                 
-                # Create the commit with a random time during work hours
-                success = self.backdate_commit(
-                    repo_path=repo_path,
-                    date=date_str,
-                    commit_message=commit_message,
-                    file_content=content,
-                    file_path=file_path,
-                    push=False  # Don't push individual commits
-                )
+                for date_str in plan.dates:
+                    day_commits = commits_by_date.get(date_str, [])
+                    
+                    # Skip dates with 0 commits (for natural pattern)
+                    if not day_commits:
+                        print(f"Skipping {date_str} (no commits scheduled)")
+                        results[date_str] = True
+                        continue
+                    
+                    first_index = index
+                    index += len(day_commits)
+                    
+                    if index <= done:
+                        print(f"Skipping {date_str} (already committed)")
+                        results[date_str] = True
+                        continue
+                    
+                    print(f"Creating {len(day_commits)} commits for {date_str}")
+                    
+                    if backend != "commit":
+                        # The whole series is written after the loop
+                        results[date_str] = True
+                        continue
+                    
+                    success = False
+                    
+                    for i, commit in enumerate(day_commits):
+                        if first_index + i < done:
+                            continue
+                        
+                        # Timestamps come from the commit environment, only wait if asked to
+                        pacing.before_commit(i)
+                        
+                        success = self.backdate_commit(
+                            repo_path=repo_path,
+                            date=datetime.datetime.strptime(commit.timestamp, GIT_DATE_FORMAT),
+                            commit_message=commit.message,
+                            file_content=plan.content(commit),
+                            file_path=commit.path,
+                            push=False,  # Don't push individual commits
+                            repo=repo
+                        )
+                        
+                        if not success:
+                            break
+                        
+                        with self.instrumentation.phase("journal"):
+                            journal.record_commits(first_index + i, [repo.head.commit.hexsha])
+                    
+                    results[date_str] = success
+                    
+                    if not success:
+                        # The journal holds a prefix of the plan, so later commits must wait for this one
+                        print(f"Stopping at the failed commit for {date_str}; use --resume to retry from there")
+                        for later_date in plan.dates:
+                            results.setdefault(later_date, False)
+                        break
+                    
+                    if push:
+                        unpushed_dates.append(date_str)
+                        
+                        # A push sends every earlier commit too, so a failed push is
+                        # simply retried by the next one
+                        if push_strategy != "end" and len(unpushed_dates) >= dates_per_push:
+                            error = self._push(repo, pacing, journal)
+                            if error:
+                                push_failures.append((list(unpushed_dates), error))
+                            else:
+                                unpushed_dates = []
+                
+                if backend != "commit" and done < len(plan):
+                    shas = self._run_batch_backend(repo, plan.tail(done), results, backend)
+                    if shas is not None:
+                        with self.instrumentation.phase("journal"):
+                            journal.record_commits(done, shas)
+                        if push:
+                            unpushed_dates = [date_str for date_str in commits_by_date if results.get(date_str)]
+                
+                if unpushed_dates:
+                    error = self._push(repo, pacing, journal)
+                    if error:
+                        push_failures.append((list(unpushed_dates), error))
+                        
+                        # Retry once at the end before giving up
+                        print("Retrying push...")
+                        error = self._push(repo, pacing, journal)
+                        if error:
+                            push_failures.append((list(unpushed_dates), error))
+                            for date_str in unpushed_dates:
+                                results[date_str] = False
                 
-                if not success:
-                    break
+                if all(results.values()):
+                    journal.finish()
+            finally:
+                journal.close()
+        
+        if push_failures:
+            print(f"{len(push_failures)} push attempt(s) failed:")
+            for dates, error in push_failures:
+                print(f"  - {len(dates)} date(s) up to {dates[-1]}: {error.splitlines()[0]}")
+        
+        if pacing.throttled_seconds:
+            print(f"Time spent throttled: {pacing.throttled_seconds:.1f}s")
+        
+        return results
+    
+    def _expire_own_calendars(self) -> None:
+        """Mark the authenticated user's cached calendars stale after a push added contributions."""
+        if not self.cache:
+            return
+        
+        try:
+            username = self._authenticated_login()
+        except Exception:
+            return  # Best effort, the entries still expire with the TTL
+        
+        for mode in ("default", "incremental", "history"):
+            self.cache.expire(f"calendar:{username.lower()}:{mode}")
+    
+    def _push(self, repo: Repo, pacing: PacingPolicy, journal: Optional[CheckpointJournal] = None) -> Optional[str]:
+        """Push the current branch.
+        
+        Args:
+            repo: Opened repository
+            pacing: Pacing policy applied before the push
+            journal: Checkpoint journal to record a successful push in
+            
+        Returns:
+            None on success, otherwise the error message
+        """
+        try:
+            pacing.before_push()
+            self.instrumentation.count("subprocesses")
+            with self.instrumentation.phase("push"):
+                repo.git.push()
+            self._expire_own_calendars()
+            if journal is not None:
+                journal.record_push(repo.head.commit.hexsha)
+            return None
+        except Exception as e:
+            print(f"Error pushing commits: {e}")
+            return str(e)
+    
+    def _run_batch_backend(self, repo: Repo, plan: CommitPlan, results: Dict[str, bool],
+                           backend: str) -> Optional[List[str]]:
+        """Write a whole plan with the fast-import or objects backend.
+        
+        Args:
+            repo: Opened repository
+            plan: Commit plan to write
+            results: Per-date results, updated in place on failure
+            backend: "fast-import" or "objects"
+            
+        Returns:
+            SHAs of the written commits in plan order, None on failure
+        """
+        try:
+            if backend == "fast-import":
+                print(f"Writing {len(plan)} commits with git fast-import...")
+                return self._fast_import_commits(repo.working_tree_dir, plan)
+            else:
+                print(f"Writing {len(plan)} commits to the object database...")
+                return self._object_db_commits(repo, plan)
+        except Exception as e:
+            print(f"Error importing commits: {e}")
+            for commit in plan.commits:
+                results[commit.date] = False
+            return None
+    
+    def resumable_plan(self, repo_path: str, run: Dict) -> Optional[CommitPlan]:
+        """Return the plan of an interrupted run, so resuming it needs no planning.
+        
+        Args:
+            repo_path: Path to local git repository
+            run: Planner and options of the run, see CheckpointJournal.run_description
+            
+        Returns:
+            The plan of the repository's checkpoint journal, None without a journal
+            
+        Raises:
+            ValueError: If repo_path is not a git repository with a working
+                tree, or the journal belongs to a different run
+        """
+        with self.open_repository(repo_path) as repo:
+            journal = CheckpointJournal(os.path.join(repo.git_dir, JOURNAL_FILE_NAME))
+            if not journal.load():
+                return None
+        
+        if journal.run != CheckpointJournal.run_description(journal.plan, run):
+            raise ValueError(f"Checkpoint journal {journal.path} belongs to a different run")
+        return journal.plan
+    
+    def _start_journal(self, repo: Repo, journal: CheckpointJournal, plan: CommitPlan, resume: bool,
+                       run: Optional[Dict] = None) -> CommitPlan:
+        """Start a new checkpoint journal for a plan, or resume the one in the repository.
+        
+        Commits found after the journal's last durable point, left by a crash
+        between a commit and its journal record, are adopted if they are the
+        next planned commits.
+        
+        Args:
+            repo: Opened repository
+            journal: Checkpoint journal of the repository
+            plan: Plan of the run
+            resume: Whether to continue the run recorded in the journal
+            run: Planner and options of the run, see CheckpointJournal.run_description
+            
+        Returns:
+            The plan to execute, the journal's own plan when resuming
+            
+        Raises:
+            ValueError: If the journal belongs to a different run, or the
+                repository has commits that are not part of the run
+        """
+        from git.exc import GitCommandError
+        
+        head = repo.head.commit.hexsha if repo.head.is_valid() else None
+        run = CheckpointJournal.run_description(plan, run)
+        
+        if not (resume and journal.load()):
+            if resume:
+                print(f"No checkpoint journal in {repo.git_dir}, starting a new run")
+            journal.start(plan, head, run)
+            return plan
+        
+        if journal.run != run:
+            raise ValueError(f"Checkpoint journal {journal.path} belongs to a different run")
+        
+        if head != journal.head:
+            moved = ValueError(f"Repository HEAD moved since the checkpoint journal {journal.path} was written")
+            try:
+                if head is None or (journal.head and not repo.is_ancestor(journal.head, head)):
+                    raise moved
+            except GitCommandError as e:
+                raise moved from e  # The journaled commit is gone
+            
+            new_commits = list(repo.iter_commits(f"{journal.head}..HEAD" if journal.head else "HEAD", reverse=True))
+            expected = journal.plan.commits[journal.completed:journal.completed + len(new_commits)]
+            
+            if len(new_commits) != len(expected) or any(
+                    commit.message.strip() != planned.message.strip()
+                    or commit.authored_datetime.strftime(GIT_DATE_FORMAT) != planned.timestamp
+                    for commit, planned in zip(new_commits, expected)):
+                raise moved
             
-            if success and push and actual_commit_count > 0:
-                try:
-                    repo = Repo(repo_path)
-                    repo.git.push()
-                except Exception as e:
-                    print(f"Error pushing commits: {e}")
-                    success = False
+            journal.record_commits(journal.completed, [commit.hexsha for commit in new_commits])
+        
+        print(f"Resuming from checkpoint journal: {journal.completed}/{len(journal.plan)} commits already written")
+        return journal.plan
+    
+    def execute_plans(self,
+                      plans: Dict[str, CommitPlan],
+                      push: bool = False,
+                      backend: str = "commit",
+                      pacing: Optional[PacingPolicy] = None,
+                      push_strategy: str = "end",
+                      push_every: int = 10,
+                      resume: bool = False,
+                      run: Optional[Dict] = None,
+                      max_workers: Optional[int] = None) -> Dict[str, Dict]:
+        """Execute one plan per repository on a bounded process pool.
+        
+        Every repository is handled by exactly one worker process, so git
+        locks of different workers never collide. Workers only run git; any
+        API calls belong to planning, which happens before, and to expiring
+        the cached calendars after pushes, which the parent does once after.
+        
+        Args:
+            plans: Commit plan per repository path
+            push: Whether to push the commits of each repository
+            backend: Commit backend, see execute_plan
+            pacing: Pacing policy, applied within each worker
+            push_strategy: When to push, see execute_plan
+            push_every: Number of dates per push for the "every-n" strategy
+            resume: Continue the interrupted run of each repository, see execute_plan
+            run: Planner and options shared by the plans, see execute_plan
+            max_workers: Maximum number of worker processes, defaults to
+                the number of CPUs
+            
+        Returns:
+            Dictionary mapping each repository path to a report with
+            "results" (as returned by execute_plan), "succeeded", "failed",
+            "seconds", "error" (None or the message) and "log" (its output)
             
-            results[date_str] = success
+        Raises:
+            ValueError: If the same repository is listed twice
+        """
+        seen = {}
+        for repo_path in plans:
+            real_path = os.path.realpath(repo_path)
+            if real_path in seen:
+                raise ValueError(f"Repository listed twice: {seen[real_path]} and {repo_path}")
+            seen[real_path] = repo_path
         
-        return results
+        options = {
+            "push": push,
+            "backend": backend,
+            "pacing": pacing,
+            "push_strategy": push_strategy,
+            "push_every": push_every,
+            "resume": resume,
+            "run": run
+        }
+        max_workers = max(1, min(max_workers or os.cpu_count() or 1, len(plans)))
+        reports = {}
+        
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(_execute_plan_worker, self.config_path, repo_path, plan.to_dict(), options,
+                            self.instrumentation.enabled): repo_path
+                for repo_path, plan in plans.items()
+            }
+            for future in as_completed(futures):
+                repo_path = futures[future]
+                report = future.result()
+                self.instrumentation.merge(report.pop("metrics"))
+                reports[repo_path] = report
+                
+                if report["error"]:
+                    status = f"error: {report['error']}"
+                else:
+                    status = f"{report['succeeded']}/{len(report['results'])} dates"
+                print(f"[{len(reports)}/{len(plans)}] {repo_path}: {status} ({report['seconds']:.1f}s)")
+        
+        if push and any(report["succeeded"] for report in reports.values()):
+            self._expire_own_calendars()
+        
+        # Report in the order the repositories were given
+        return {repo_path: reports[repo_path] for repo_path in plans}
     
-    def fill_missing_streak_dates(self, repo_path: str, days_back: int = 30, push: bool = False) -> Dict[str, bool]:
+    def fill_missing_streak_dates(self, repo_path: str, days_back: int = 30, push: bool = False,
+                                  backend: str = "commit",
+                                  pacing: Optional[PacingPolicy] = None,
+                                  push_strategy: str = "end",
+                                  push_every: int = 10) -> Dict[str, bool]:
         """Automatically fill in missing dates in your contribution history.
         
         Args:
             repo_path: Path to local git repository
             days_back: How many days back to analyze and fill
             push: Whether to push the commits to GitHub
+            backend: Commit backend passed through to bulk_backdate
+            pacing: Pacing policy passed through to bulk_backdate
+            push_strategy: When to push, see execute_plan
+            push_every: Number of dates per push for the "every-n" strategy
             
         Returns:
             Dictionary mapping dates to success status
         """
-        # Get streak information
-        streak_info = self.analyze_streak()
+        # The default calendar covers the last year; look further back in the full history.
+        # A cached calendar may predate the last fill, which would backdate the same dates again
+        gaps = self.gap_index(history=days_back > 365, fresh=True)
         
-        # Filter missing dates to only include those within days_back
         today = datetime.date.today()
-        cutoff_date = (today - datetime.timedelta(days=days_back)).isoformat()
-        missing_dates = [date for date in streak_info["missing_dates"] if date >= cutoff_date]
+        missing_dates = gaps.dates_between(today - datetime.timedelta(days=days_back), today)
         
         if not missing_dates:
             print("No missing dates found in the specified time range.")
             return {}
         
-        # Sort dates chronologically
-        missing_dates.sort()
-        
         # Calculate a realistic maximum number of commits per day
         # Most developers don't have more than 5-10 commits per day on average
         max_commits = random.randint(5, 10)
@@ -663,7 +3128,11 @@ class SampleClass:
             repo_path=repo_path,
             dates=missing_dates,
             commit_count=max_commits,  # This is now used as a maximum, actual count will vary
-            push=push
+            push=push,
+            backend=backend,
+            pacing=pacing,
+            push_strategy=push_strategy,
+            push_every=push_every
         )
     
     def create_natural_streak_pattern(self, 
@@ -672,7 +3141,13 @@ class SampleClass:
                                end_date: str, 
                                reference_username: Optional[str] = None,
                                max_daily_commits: int = 8,
-                               push: bool = False) -> Dict[str, bool]:
+                               push: bool = False,
+                               backend: str = "commit",
+                               pacing: Optional[PacingPolicy] = None,
+                               seed: Optional[int] = None,
+                               push_strategy: str = "end",
+                               push_every: int = 10,
+                               resume: bool = False) -> Dict[str, bool]:
         """Create a natural looking streak pattern, optionally based on a reference user.
         
         This creates a more realistic commit pattern that follows typical developer habits:
@@ -689,261 +3164,591 @@ class SampleClass:
             reference_username: Optional GitHub username to analyze for pattern reference
             max_daily_commits: Maximum number of commits per day
             push: Whether to push the commits to GitHub
+            backend: "commit" for one git commit per call, "fast-import"
+                to write the whole series with a single git fast-import, or
+                "objects" to write it directly into the object database
+            pacing: Delay/rate-limit policy, defaults to no delay
+            seed: Seed for reproducible commit counts
+            push_strategy: When to push, see execute_plan
+            push_every: Number of dates per push for the "every-n" strategy
+            resume: Continue the interrupted run in repo_path, see execute_plan
             
         Returns:
             Dictionary mapping dates to success status
         """
-        start = datetime.datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.datetime.strptime(end_date, "%Y-%m-%d")
+        run = _planner_run("natural", start_date=start_date, end_date=end_date,
+                           reference_username=reference_username, max_daily_commits=max_daily_commits, seed=seed)
         
-        # Generate list of dates
-        dates = []
-        current = start
-        while current <= end:
-            dates.append(current.strftime("%Y-%m-%d"))
-            current += datetime.timedelta(days=1)
+        # The journal's plan is reused as-is, unseeded patterns can't be planned again
+        plan = self.resumable_plan(repo_path, run) if resume else None
+        if plan is None:
+            with self.instrumentation.phase("plan"):
+                plan = self.plan_natural_streak_pattern(start_date, end_date, reference_username,
+                                                        max_daily_commits, seed)
+        results = self.execute_plan(repo_path, plan, push=push, backend=backend, pacing=pacing,
+                                    push_strategy=push_strategy, push_every=push_every, resume=resume, run=run)
+        
+        # Final statistics
+        successful_days = sum(1 for success in results.values() if success)
+        print(f"\nStreak creation complete: {successful_days}/{len(plan.dates)} days successfully processed")
+        
+        return results
+    
+    def plan_natural_streak_pattern(self,
+                                    start_date: str,
+                                    end_date: str,
+                                    reference_username: Optional[str] = None,
+                                    max_daily_commits: int = 8,
+                                    seed: Optional[int] = None) -> CommitPlan:
+        """Plan the commits for create_natural_streak_pattern without touching any repository.
+        
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            reference_username: Optional GitHub username to analyze for pattern reference
+            max_daily_commits: Maximum number of commits per day
+            seed: Seed for reproducible commit counts
+            
+        Returns:
+            Commit plan covering the active dates of the pattern
+        """
+        dates = _date_range(start_date, end_date)
         
         # If reference username provided, analyze their pattern
         activity_pattern = {}
         if reference_username:
-            try:
-                print(f"Analyzing commit pattern of GitHub user: {reference_username}")
-                streak_info = self.analyze_streak(reference_username)
-                
-                # Use the contribution_days to identify active/inactive days
-                contribution_days = streak_info.get("contribution_days", [])
-                
-                # Map day of week to activity levels based on reference user
-                day_of_week_activity = [0, 0, 0, 0, 0, 0, 0]  # Sun-Sat
-                day_of_week_count = [0, 0, 0, 0, 0, 0, 0]
-                
-                for day in contribution_days:
-                    date = datetime.datetime.strptime(day["date"], "%Y-%m-%d")
-                    day_index = date.weekday()
-                    contribution_count = day["count"]
-                    
-                    day_of_week_activity[day_index] += contribution_count
-                    day_of_week_count[day_index] += 1
-                
-                # Calculate average commits per day of week
-                for i in range(7):
-                    if day_of_week_count[i] > 0:
-                        day_of_week_activity[i] /= day_of_week_count[i]
-                    # Cap at max_daily_commits
-                    day_of_week_activity[i] = min(day_of_week_activity[i], max_daily_commits)
-                
-                print(f"Reference user activity pattern per day of week:")
-                days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-                for i in range(7):
-                    print(f"  {days[i]}: {day_of_week_activity[i]:.1f} commits on average")
-                
-                activity_pattern = {
-                    "day_of_week_activity": day_of_week_activity
-                }
-                
-            except Exception as e:
-                print(f"Error analyzing reference user: {e}")
-                print("Using default activity pattern.")
-                activity_pattern = {}
+            activity_pattern = self._reference_activity_pattern(reference_username, max_daily_commits)
         
-        # Apply the pattern to generate a realistic streak
-        # We'll do this by modifying the dates list to set commit counts
-        dates_with_metadata = []
-        
-        for date_str in dates:
-            dt = datetime.datetime.strptime(date_str, "%Y-%m-%d")
-            day_of_week = dt.weekday()  # 0-6 (Mon-Sun)
-            
-            if activity_pattern and "day_of_week_activity" in activity_pattern:
-                # Use reference user's pattern
-                avg_commits = activity_pattern["day_of_week_activity"][day_of_week]
-                
-                # Add some randomness around the average
-                # For smaller numbers (0-2), keep it precise
-                # For larger numbers, add more variation
+        # Build one weight table per day of week (Mon-Sun)
+        if activity_pattern and "day_of_week_activity" in activity_pattern:
+            # Use reference user's pattern, with some randomness around the average
+            weekday_weights = []
+            for avg_commits in activity_pattern["day_of_week_activity"]:
                 if avg_commits < 1:
                     # Mostly 0, occasionally 1
-                    commit_count = random.choices([0, 1], weights=[80, 20], k=1)[0]
+                    weekday_weights.append([80, 20])
                 elif avg_commits < 2:
                     # Mix of 0, 1, and occasionally 2
-                    commit_count = random.choices([0, 1, 2], weights=[20, 60, 20], k=1)[0]
+                    weekday_weights.append([20, 60, 20])
                 else:
                     # Normal distribution around the average
                     variance = max(1, avg_commits / 2)
-                    commit_count = int(random.normalvariate(avg_commits, variance))
-                    commit_count = max(0, min(commit_count, max_daily_commits))
-            else:
-                # Default pattern based on typical work week
-                is_weekend = day_of_week >= 5
-                
-                if is_weekend:
-                    # Weekends have fewer commits
-                    commit_count = random.choices(
-                        [0, 1, 2], 
-                        weights=[50, 40, 10],  # 50% chance of 0, 40% chance of 1, 10% chance of 2
-                        k=1
-                    )[0]
-                else:
-                    # Workdays have more commits, with variance by day
-                    # Monday and Friday less active than midweek
-                    if day_of_week in [0, 4]:  # Monday or Friday
-                        max_count = max_daily_commits - 2
-                        weights = [10, 30, 40, 15, 5]  # 0, 1, 2, 3, 4
-                    else:  # Tuesday, Wednesday, Thursday
-                        max_count = max_daily_commits
-                        weights = [5, 15, 30, 25, 15, 5, 3, 2]  # 0-7
-                    
-                    # Adjust weights array to match the max count
-                    weights = weights[:max_count + 1]
-                    # Ensure weights sum to 100
-                    total = sum(weights)
-                    weights = [w * 100 / total for w in weights]
-                    
-                    # Ensure the population and weights arrays match in length
-                    population = list(range(max_count + 1))
-                    if len(population) != len(weights):
-                        # Trim or extend weights to match population length
-                        if len(weights) > len(population):
-                            weights = weights[:len(population)]
-                        else:
-                            weights.extend([1] * (len(population) - len(weights)))
-                        # Normalize weights again
-                        total = sum(weights)
-                        weights = [w * 100 / total for w in weights]
-                    
-                    commit_count = random.choices(
-                        population,
-                        weights=weights,
-                        k=1
-                    )[0]
-                        
-            dates_with_metadata.append({
-                "date": date_str,
-                "commit_count": commit_count
-            })
+                    weekday_weights.append(CommitCountSampler.normal_table(avg_commits, variance, max_daily_commits))
+        else:
+            # Default pattern based on typical work week
+            # Weekends have fewer commits (50% chance of 0, 40% chance of 1, 10% chance of 2)
+            weekend = [50, 40, 10]
+            # Workdays have more commits, Monday and Friday less active than midweek
+            mon_fri = CommitCountSampler.truncated_table(max_daily_commits - 2, [10, 30, 40, 15, 5])  # 0-4
+            midweek = CommitCountSampler.truncated_table(max_daily_commits, [5, 15, 30, 25, 15, 5, 3, 2])  # 0-7
+            weekday_weights = [mon_fri, midweek, midweek, midweek, mon_fri, weekend, weekend]
+        
+        # Apply the pattern to generate a realistic streak
+        counts = CommitCountSampler(weekday_weights, seed).sample(dates)
+        commit_counts = dict(zip(dates, counts))
             
         # Summarize the generated pattern
-        active_days = sum(1 for d in dates_with_metadata if d["commit_count"] > 0)
-        total_commits = sum(d["commit_count"] for d in dates_with_metadata)
+        active_days = sum(1 for count in counts if count > 0)
+        total_commits = sum(counts)
         
         print(f"Generated natural streak pattern from {start_date} to {end_date}:")
         print(f"  - {len(dates)} total days, {active_days} active days ({active_days/len(dates)*100:.1f}%)")
         print(f"  - {total_commits} total commits, {total_commits/len(dates):.1f} commits per day average")
         
-        # Create the commits based on pattern
-        filtered_dates = [d["date"] for d in dates_with_metadata if d["commit_count"] > 0]
-        commit_counts = {d["date"]: d["commit_count"] for d in dates_with_metadata if d["commit_count"] > 0}
+        # Only active dates are part of the plan
+        plan = CommitPlan([date_str for date_str in dates if commit_counts[date_str] > 0])
+        self._plan_commits(plan, ((date_str, commit_counts[date_str]) for date_str in plan.dates))
         
-        # Process each date for creation
-        results = {}
+        return plan
+    
+    def _reference_activity_pattern(self, reference_username: str, max_daily_commits: int) -> Dict:
+        """Derive average commits per day of week from a reference user.
         
-        for date_str in filtered_dates:
-            commit_count = commit_counts[date_str]
-            print(f"Creating {commit_count} commits for {date_str}")
-            
-            # Different file types for variety
-            file_types = [
-                "docs/updates.md",
-                "src/main.py",
-                "utils/helpers.py",
-                "config/settings.json",
-                "README.md",
-                "tests/test_main.py",
-                "data/sample.json"
-            ]
+        Args:
+            reference_username: GitHub username to analyze
+            max_daily_commits: Cap for the per-day averages
             
-            # Choose random subset of files to modify for this date
-            daily_files = random.sample(file_types, min(commit_count, len(file_types)))
-            if commit_count > len(daily_files):
-                # Add repeats if needed
-                daily_files.extend(random.sample(file_types, commit_count - len(daily_files)))
+        Returns:
+            Dictionary with 'day_of_week_activity' (Mon-Sun), or empty on error
+        """
+        try:
+            print(f"Analyzing commit pattern of GitHub user: {reference_username}")
+            streak_info = self.analyze_streak(reference_username)
             
-            success = False
+            # Use the contribution_days to identify active/inactive days
+            contribution_days = streak_info.get("contribution_days", [])
             
-            for i in range(commit_count):
-                # Pick a file to modify
-                file_type = daily_files[i]
-                file_path = f"streak_updates/{date_str}/{file_type}"
+            # Map day of week to activity levels based on reference user
+            day_of_week_activity = [0, 0, 0, 0, 0, 0, 0]  # Mon-Sun
+            day_of_week_count = [0, 0, 0, 0, 0, 0, 0]
+            
+            for day in contribution_days:
+                date = datetime.datetime.strptime(day["date"], "%Y-%m-%d")
+                day_index = date.weekday()
+                contribution_count = day["count"]
                 
-                # Create content based on file type
-                if file_path.endswith('.md'):
-                    content = f"# Update for {date_str}\n\nDocumentation update #{i+1}.\n\n## Changes\n\n- Updated documentation\n- Improved examples\n- Fixed typos"
-                elif file_path.endswith('.py'):
-                    content = f'''"""
-Module updated on {date_str}
-"""
+                day_of_week_activity[day_index] += contribution_count
+                day_of_week_count[day_index] += 1
+            
+            # Calculate average commits per day of week
+            for i in range(7):
+                if day_of_week_count[i] > 0:
+                    day_of_week_activity[i] /= day_of_week_count[i]
+                # Cap at max_daily_commits
+                day_of_week_activity[i] = min(day_of_week_activity[i], max_daily_commits)
+            
+            print(f"Reference user activity pattern per day of week:")
+            days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+            for i in range(7):
+                print(f"  {days[i]}: {day_of_week_activity[i]:.1f} commits on average")
+            
+            return {
+                "day_of_week_activity": day_of_week_activity
+            }
+            
+        except Exception as e:
+            print(f"Error analyzing reference user: {e}")
+            print("Using default activity pattern.")
+            return {}
 
-def sample_function_{date_str.replace("-", "")}_{i}():
-    """Example function added in update #{i+1}."""
-    print("Sample function implementation")
-    return True
 
-# Added in update #{i+1}
-class SampleClass:
-    """Example class for demonstration."""
+def _execute_plan_worker(config_path: str, repo_path: str, plan_data: Dict, options: Dict,
+                         instrumentation: bool = False) -> Dict:
+    """Execute one repository's plan in a worker process, see StreakManager.execute_plans.
     
-    def __init__(self):
-        """Initialize the class."""
-        self.value = "{date_str}"
+    Module-level so it can be pickled for the process pool. The worker's
+    output is captured and returned in the report instead of interleaving
+    with the other workers.
+    """
+    manager = StreakManager(config_path, skip_token_check=True)
+    manager.instrumentation = Instrumentation(instrumentation)
+    manager.cache = None  # No API calls in workers, the parent expires calendars after pushes
+    log = io.StringIO()
+    results = {}
+    error = None
     
-    def get_value(self):
-        """Return the stored value."""
-        return self.value
-'''
-                elif file_path.endswith('.json'):
-                    content = f'''{{
-  "update_date": "{date_str}",
-  "update_number": {i+1},
-  "changes": [
-    "Updated configuration",
-    "Modified settings",
-    "Adjusted parameters"
-  ]
-}}'''
-                else:
-                    content = f"# Update for {date_str}\n\nCommit #{i+1} of {commit_count}\n\nGenerated content for file type: {file_path.split('.')[-1]}"
-                
-                # Generate appropriate commit message for context
-                commit_message = self._generate_commit_message(
-                    date_str=date_str,
-                    file_path=file_path,
-                    commit_index=i,
-                    total_commits=commit_count
-                )
-                
-                # Add variable delay between commits for more natural behavior
-                if i > 0:
-                    # More natural pause between commits
-                    time.sleep(random.uniform(1.0, 5.0))
-                
-                # Create the commit with a random time during work hours
-                success = self.backdate_commit(
-                    repo_path=repo_path,
-                    date=date_str,
-                    commit_message=commit_message,
-                    file_content=content,
-                    file_path=file_path,
-                    push=False  # Don't push individual commits
-                )
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(log):
+            results = manager.execute_plan(repo_path, CommitPlan.from_dict(plan_data), **options)
+    except Exception as e:
+        error = str(e)
+    
+    succeeded = sum(1 for success in results.values() if success)
+    return {
+        "results": results,
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "seconds": round(time.perf_counter() - start, 3),
+        "error": error,
+        "log": log.getvalue(),
+        "metrics": manager.instrumentation.summary()
+    }
+
+
+class StreakDaemon:
+    """Serves one warm StreakManager over JSON-RPC 2.0.
+    
+    The manager, with its pooled HTTP session and caches, lives as long as
+    the daemon, so repeat requests skip config loading, TLS handshakes and
+    fetching fresh calendars again. Requests are JSON-RPC 2.0 objects (or
+    batches) with named or positional params, sent as newline-delimited
+    JSON over a Unix socket or as the body of an HTTP POST, e.g.
+    
+        {"jsonrpc": "2.0", "id": 1, "method": "analyze", "params": {"username": "octocat"}}
+    
+    Executions in the same repository are serialized; different
+    repositories and all other methods run concurrently.
+    
+    Only the Unix socket, which is private to the user, offers execute. The
+    HTTP transport can be reached by any local process and any web page in
+    a browser, so it is read-only and refuses cross-origin requests.
+    """
+    
+    METHODS = ("analyze", "analyze_many", "plan", "execute", "stats")
+    HTTP_METHODS = ("analyze", "analyze_many", "plan", "stats")
+    
+    def __init__(self, manager: StreakManager, pacing: Optional[PacingPolicy] = None):
+        """Initialize the daemon.
+        
+        Args:
+            manager: Configured StreakManager to keep warm
+            pacing: Pacing policy for executions
+        """
+        self.manager = manager
+        self.pacing = pacing
+        self.started = time.time()
+        self.requests = 0
+        self._repo_locks = {}
+        self._lock = threading.Lock()
+    
+    def analyze(self, username: Optional[str] = None, history: bool = False) -> Dict:
+        """Streak information of a user, see StreakManager.analyze_streak."""
+        return self.manager.analyze_streak(username, history=history)
+    
+    def analyze_many(self, usernames: List[str]) -> Dict[str, Dict]:
+        """Streak information of several users, see StreakManager.analyze_streaks."""
+        return self.manager.analyze_streaks(usernames)
+    
+    def plan(self, start_date: str, end_date: str, pattern: str = "natural",
+             reference_username: Optional[str] = None, max_daily_commits: int = 8,
+             commit_count: int = 1, seed: Optional[int] = None) -> Dict:
+        """Plan commits without executing them.
+        
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            pattern: "natural" for plan_natural_streak_pattern, or "bulk"
+                for plan_bulk_backdate over every date in the range
+            reference_username: Reference user of the natural pattern
+            max_daily_commits: Maximum commits per day of the natural pattern
+            commit_count: Commits per date (or max if randomized) of the bulk pattern
+            seed: Seed for reproducible commit counts
+            
+        Returns:
+            The plan as created by CommitPlan.to_dict
+        """
+        if pattern == "natural":
+            plan = self.manager.plan_natural_streak_pattern(start_date, end_date, reference_username,
+                                                            max_daily_commits, seed)
+        elif pattern == "bulk":
+            plan = self.manager.plan_bulk_backdate(_date_range(start_date, end_date), commit_count, seed)
+        else:
+            raise ValueError(f"Unsupported plan pattern: {pattern}")
+        return plan.to_dict()
+    
+    def execute(self, repo_path: str, plan: Dict, push: bool = False, backend: str = "commit",
+                push_strategy: str = "end", push_every: int = 10) -> Dict[str, bool]:
+        """Execute a plan created by the plan method, see StreakManager.execute_plan."""
+        with self._lock:
+            repo_lock = self._repo_locks.setdefault(os.path.realpath(repo_path), threading.Lock())
+        
+        with repo_lock:
+            return self.manager.execute_plan(repo_path, CommitPlan.from_dict(plan), push=push, backend=backend,
+                                             pacing=self.pacing, push_strategy=push_strategy,
+                                             push_every=push_every)
+    
+    def stats(self) -> Dict:
+        """Uptime, request count, API usage and instrumentation of the daemon."""
+        return {
+            "uptime_seconds": round(time.time() - self.started, 3),
+            "requests": self.requests,
+            "api": self.manager.rate_limiter.stats(),
+            "metrics": self.manager.instrumentation.summary()
+        }
+    
+    def handle(self, request: Union[Dict, List], methods: Tuple[str, ...] = METHODS) -> Optional[Union[Dict, List]]:
+        """Answer a JSON-RPC request or batch; notifications get no response.
+        
+        Args:
+            request: Decoded request or batch
+            methods: Methods the transport offers
+        """
+        if isinstance(request, list):
+            responses = [self.handle(item, methods) for item in request]
+            responses = [response for response in responses if response is not None]
+            return responses or None
+        
+        if not isinstance(request, dict) or request.get("jsonrpc") != "2.0" or "method" not in request:
+            return _jsonrpc_error(None, -32600, "Invalid Request")
+        
+        request_id = request.get("id")
+        method = request["method"]
+        params = request.get("params", {})
+        with self._lock:
+            self.requests += 1
+        
+        if method not in methods:
+            return _jsonrpc_error(request_id, -32601, f"Method not found: {method}")
+        
+        try:
+            if isinstance(params, dict):
+                result = getattr(self, method)(**params)
+            else:
+                result = getattr(self, method)(*params)
+        except (TypeError, ValueError) as e:
+            return _jsonrpc_error(request_id, -32602, f"Invalid params: {e}")
+        except GitHubAPIError as e:
+            return _jsonrpc_error(request_id, -32000, str(e), {"status_code": e.status_code})
+        except Exception as e:
+            return _jsonrpc_error(request_id, -32000, str(e))
+        
+        if "id" not in request:
+            return None
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+    
+    def handle_json(self, payload: bytes, methods: Tuple[str, ...] = METHODS) -> Optional[bytes]:
+        """Answer a serialized request with a serialized response."""
+        try:
+            request = json.loads(payload)
+        except ValueError:
+            response = _jsonrpc_error(None, -32700, "Parse error")
+        else:
+            response = self.handle(request, methods)
+        return None if response is None else json.dumps(response).encode("utf-8")
+    
+    def serve_unix(self, socket_path: str) -> None:
+        """Serve newline-delimited JSON-RPC on a Unix socket until interrupted.
+        
+        The socket is only accessible by the current user.
+        """
+        import socketserver
+        
+        daemon = self
+        
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    if not line.strip():
+                        continue
+                    response = daemon.handle_json(line)
+                    if response is not None:
+                        self.wfile.write(response + b"\n")
+                        self.wfile.flush()
+        
+        if os.path.exists(socket_path):
+            os.remove(socket_path)  # Left behind by a previous daemon
+        
+        old_umask = os.umask(0o177)
+        try:
+            server = socketserver.ThreadingUnixStreamServer(socket_path, Handler)
+        finally:
+            os.umask(old_umask)
+        server.daemon_threads = True
+        
+        print(f"Serving JSON-RPC on unix socket {socket_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            os.remove(socket_path)
+    
+    def serve_http(self, host: str = "127.0.0.1", port: int = 8765) -> None:
+        """Serve the read-only HTTP_METHODS over HTTP POST until interrupted.
+        
+        Requests must be sent as application/json without an Origin header.
+        Browsers can only send that content type after a CORS preflight,
+        which is never answered, and they add Origin to cross-site requests.
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        
+        daemon = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if self.headers.get("Origin") is not None:
+                    self.send_error(403, "Cross-origin requests are not allowed")
+                    return
+                if self.headers.get_content_type() != "application/json":
+                    self.send_error(415, "Content-Type must be application/json")
+                    return
                 
-                if not success:
-                    break
+                payload = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                response = daemon.handle_json(payload, daemon.HTTP_METHODS) or b""
+                self.send_response(200 if response else 204)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(response)))
+                self.end_headers()
+                self.wfile.write(response)
             
-            if success and push:
-                try:
-                    repo = Repo(repo_path)
-                    repo.git.push()
-                except Exception as e:
-                    print(f"Error pushing commits: {e}")
-                    success = False
+            def log_message(self, format, *args):
+                pass  # Keep the daemon's output for the manager
+        
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        
+        print(f"Serving JSON-RPC on http://{host}:{server.server_address[1]}/")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
+
+def _jsonrpc_error(request_id, code: int, message: str, data: Optional[Dict] = None) -> Dict:
+    """Build a JSON-RPC 2.0 error response."""
+    error = {"code": code, "message": message}
+    if data is not None:
+        error["data"] = data
+    return {"jsonrpc": "2.0", "id": request_id, "error": error}
+
+
+# Export file formats: CSV, JSON Lines, or a compact columnar binary file
+EXPORT_FORMATS = ("csv", "jsonl", "columnar")
+
+# Per-day export columns
+EXPORT_FIELDS = ("username", "date", "count", "streak", "total_7_days", "total_30_days")
+
+# Columnar export layout, all little-endian: the magic, then one block per
+# user: <H name length> <name> <i first day ordinal> <I day count>, followed
+# by the columns count (H), streak, total_7_days and total_30_days (I each)
+COLUMNAR_MAGIC = b"GSMCOL1\n"
+
+
+def iter_calendar_columns(calendar: ContributionCalendar) -> Iterator[Tuple[int, int, int, int]]:
+    """Compute per-day metrics of a calendar, oldest day first.
+    
+    Yields:
+        (count, streak, total_7_days, total_30_days) per day, where streak
+        is the number of consecutive active days ending on that day and the
+        totals are rolling sums over the days ending on it
+    """
+    counts = calendar.counts
+    streak = total_7 = total_30 = 0
+    for index, count in enumerate(counts):
+        streak = streak + 1 if count else 0
+        total_7 += count - (counts[index - 7] if index >= 7 else 0)
+        total_30 += count - (counts[index - 30] if index >= 30 else 0)
+        yield count, streak, total_7, total_30
+
+
+def iter_export_rows(calendars: Iterator[Tuple[str, ContributionCalendar]]) -> Iterator[Tuple]:
+    """Flatten (username, calendar) pairs into per-day rows of EXPORT_FIELDS."""
+    for username, calendar in calendars:
+        for index, columns in enumerate(iter_calendar_columns(calendar)):
+            yield (username, calendar.date(index)) + columns
+
+
+def write_export(calendars: Iterator[Tuple[str, ContributionCalendar]], path: str, fmt: str = "csv") -> int:
+    """Stream contribution calendars to an export file.
+    
+    Calendars are consumed one at a time and rows are written as they are
+    generated, so memory does not grow with the number of users.
+    
+    Args:
+        calendars: (username, calendar) pairs, e.g. from
+            StreakManager.iter_contribution_calendars
+        path: Output file, "-" for stdout (CSV and JSONL only)
+        fmt: One of EXPORT_FORMATS
+        
+    Returns:
+        Number of day rows written
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    
+    if fmt == "columnar":
+        if path == "-":
+            raise ValueError("The columnar format cannot be written to stdout")
+        with open(path, "wb") as stream:
+            return _write_columnar(calendars, stream)
+    
+    stream = sys.stdout if path == "-" else open(path, "w", newline="", encoding="utf-8")
+    rows = 0
+    try:
+        if fmt == "csv":
+            writer = csv.writer(stream)
+            writer.writerow(EXPORT_FIELDS)
+            for row in iter_export_rows(calendars):
+                writer.writerow(row)
+                rows += 1
+        else:
+            for row in iter_export_rows(calendars):
+                stream.write(json.dumps(dict(zip(EXPORT_FIELDS, row))) + "\n")
+                rows += 1
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+    
+    return rows
+
+
+def _write_columnar(calendars: Iterator[Tuple[str, ContributionCalendar]], stream) -> int:
+    """Write calendars as columnar blocks, see COLUMNAR_MAGIC."""
+    stream.write(COLUMNAR_MAGIC)
+    rows = 0
+    
+    for username, calendar in calendars:
+        columns = (array('H', calendar.counts), array('I'), array('I'), array('I'))
+        for _, streak, total_7, total_30 in iter_calendar_columns(calendar):
+            columns[1].append(streak)
+            columns[2].append(total_7)
+            columns[3].append(total_30)
+        
+        name = username.encode("utf-8")
+        stream.write(struct.pack("<H", len(name)) + name + struct.pack("<iI", calendar.start, len(calendar)))
+        for column in columns:
+            if sys.byteorder == "big":
+                column.byteswap()
+            stream.write(column.tobytes())
+        rows += len(calendar)
+    
+    return rows
+
+
+def read_columnar_export(path: str) -> Iterator[Tuple[str, ContributionCalendar, Dict[str, array]]]:
+    """Read back a columnar export file.
+    
+    Yields:
+        (username, calendar, metrics) per user, where metrics maps
+        "streak", "total_7_days" and "total_30_days" to their columns
+    """
+    with open(path, "rb") as stream:
+        if stream.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+            raise ValueError(f"Not a columnar export file: {path}")
+        
+        while True:
+            header = stream.read(2)
+            if not header:
+                return
+            name = stream.read(struct.unpack("<H", header)[0]).decode("utf-8")
+            start, days = struct.unpack("<iI", stream.read(8))
             
-            results[date_str] = success
+            columns = []
+            for typecode in ("H", "I", "I", "I"):
+                column = array(typecode)
+                column.frombytes(stream.read(days * column.itemsize))
+                if sys.byteorder == "big":
+                    column.byteswap()
+                columns.append(column)
             
-        # Final statistics
-        successful_days = sum(1 for success in results.values() if success)
-        print(f"\nStreak creation complete: {successful_days}/{len(filtered_dates)} days successfully processed")
-        
-        return results
+            yield name, ContributionCalendar(start, columns[0]), dict(zip(EXPORT_FIELDS[3:], columns[1:]))
+
+
+def output_plan(plan: CommitPlan, save_path: Optional[str] = None, dry_run: bool = False) -> None:
+    """Save and/or print a commit plan instead of executing it.
+    
+    Args:
+        plan: Commit plan to output
+        save_path: JSON file to save the plan to
+        dry_run: Whether to print every planned commit
+    """
+    summary = plan.summary()
+    print(f"Plan: {summary['total_commits']} commits on {summary['active_days']}/{summary['total_days']} days "
+          f"({summary['unique_contents']} unique file contents)")
+    
+    if dry_run:
+        for commit in plan.commits:
+            print(f"  {commit.timestamp}  {commit.path}  {commit.message}")
+    
+    if save_path:
+        plan.save(save_path)
+        print(f"Plan saved to {save_path}")
+
+
+def output_metrics(instrumentation: Instrumentation, fmt: str = "json", path: Optional[str] = None) -> None:
+    """Print or save the instrumentation summary.
+    
+    Args:
+        instrumentation: Instrumentation of the run
+        fmt: "json" or "prometheus"
+        path: File to write to, prints to stdout if None
+    """
+    if fmt == "prometheus":
+        text = instrumentation.to_prometheus()
+    else:
+        text = json.dumps(instrumentation.summary(), indent=2) + "\n"
+    
+    if path:
+        with open(path, "w") as f:
+            f.write(text)
+        print(f"Metrics saved to {path}")
+    else:
+        print("Run metrics:")
+        print(text, end="")
 
 
 def main():
@@ -957,6 +3762,10 @@ def main():
     # Repository operations
     parser.add_argument('--list-repos', action='store_true', help='List available repositories')
     parser.add_argument('--repo', type=str, help='Repository path to use')
+    parser.add_argument('--repos', type=str, nargs='+',
+                        help='Run --plan, --natural-pattern or --bulk on several repositories in parallel')
+    parser.add_argument('--workers', type=int, help='Maximum parallel repositories for --repos (default: CPU count)')
+    parser.add_argument('--report', type=str, help='Save the combined --repos report to this JSON file')
     
     # Commit operations
     parser.add_argument('--date', type=str, help='Date for backdated commit (YYYY-MM-DD)')
@@ -964,12 +3773,23 @@ def main():
     parser.add_argument('--file', type=str, help='File to modify')
     parser.add_argument('--content', type=str, help='Content to write to file')
     parser.add_argument('--push', action='store_true', help='Push commits to GitHub')
+    parser.add_argument('--push-strategy', type=str, choices=PUSH_STRATEGIES, default='end',
+                       help='When to push during bulk operations (default: once at the end)')
+    parser.add_argument('--push-every', type=int, default=10,
+                       help='Number of dates per push with --push-strategy every-n')
     
     # Bulk operations
     parser.add_argument('--bulk', action='store_true', help='Perform bulk backdating')
     parser.add_argument('--start-date', type=str, help='Start date for bulk operation (YYYY-MM-DD)')
     parser.add_argument('--end-date', type=str, help='End date for bulk operation (YYYY-MM-DD)')
     parser.add_argument('--count', type=int, default=1, help='Number of commits per date')
+    parser.add_argument('--backend', type=str, choices=COMMIT_BACKENDS, default='commit',
+                       help='How to write commits for bulk operations (fast-import and objects write all commits '
+                            'in one pass without staging each file)')
+    parser.add_argument('--commit-delay', type=float, nargs=2, metavar=('MIN', 'MAX'), default=(0.0, 0.0),
+                       help='Random delay in seconds between commits on the same date (default: no delay)')
+    parser.add_argument('--pushes-per-minute', type=float,
+                       help='Maximum number of pushes per minute')
     
     # Natural streak pattern
     parser.add_argument('--natural-pattern', action='store_true', 
@@ -979,9 +3799,45 @@ def main():
     parser.add_argument('--max-daily-commits', type=int, default=8,
                        help='Maximum number of commits for any given day')
     
+    # Commit plans
+    parser.add_argument('--plan', type=str, help='Execute a commit plan saved with --save-plan')
+    parser.add_argument('--save-plan', type=str,
+                       help='Save the commit plan of a bulk or natural-pattern run to a JSON file instead of executing it')
+    parser.add_argument('--dry-run', action='store_true', help='Print the commit plan without creating any commits')
+    parser.add_argument('--resume', action='store_true',
+                       help='Continue an interrupted bulk, natural-pattern or plan run from its checkpoint journal')
+    parser.add_argument('--seed', type=int, help='Random seed for reproducible per-day commit counts')
+    
     # Analytics
     parser.add_argument('--analyze', action='store_true', help='Analyze current streak')
     parser.add_argument('--username', type=str, help='GitHub username for analysis')
+    parser.add_argument('--usernames', type=str, nargs='+', help='Analyze several GitHub users at once')
+    parser.add_argument('--export', type=str, metavar='PATH',
+                        help='Export the per-day calendar and streak metrics of --username/--usernames '
+                             '("-" for stdout)')
+    parser.add_argument('--export-format', type=str, choices=EXPORT_FORMATS,
+                        help='Export format, defaults to the file extension or csv')
+    parser.add_argument('--gaps', action='store_true',
+                        help='Report missing days per month between --start-date and --end-date '
+                             '(defaults to the last --days-back days)')
+    parser.add_argument('--no-cache', action='store_true', help='Bypass the local GitHub API result cache')
+    parser.add_argument('--history', action='store_true',
+                       help='Analyze all contribution years instead of the last year')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Only fetch contribution days newer than the last locally synced day')
+    parser.add_argument('--api-stats', action='store_true',
+                       help='Print GitHub API request counts and rate limit budgets at the end of the run')
+    parser.add_argument('--metrics', type=str, choices=('json', 'prometheus'),
+                        help='Record per-phase timings and counters and print them at the end of the run')
+    parser.add_argument('--metrics-file', type=str, help='Write the --metrics output to this file instead')
+    
+    # Daemon mode
+    parser.add_argument('--daemon', action='store_true',
+                        help='Keep a warm manager running and serve analyze/plan/execute over JSON-RPC')
+    parser.add_argument('--socket', type=str, default='~/.github_streak_manager.sock',
+                        help='Unix socket path for --daemon')
+    parser.add_argument('--port', type=int,
+                        help='Serve --daemon over HTTP on 127.0.0.1:PORT instead of a socket (without execute)')
     
     # Auto-fill streak
     parser.add_argument('--fill-streak', action='store_true', help='Automatically fill missing streak dates')
@@ -996,10 +3852,44 @@ def main():
         return
 
     manager = StreakManager()
+    if args.no_cache:
+        manager.cache = None
+    if args.incremental:
+        manager.incremental_sync = True
+    if args.metrics:
+        manager.instrumentation = Instrumentation(enabled=True)
+    pacing = PacingPolicy(commit_delay=tuple(args.commit_delay), pushes_per_minute=args.pushes_per_minute)
     
-    # Handle setup
-    if args.setup:
-        manager.setup(args.token)
+    try:
+        run_command(manager, args, parser, pacing)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    finally:
+        if args.api_stats:
+            print("GitHub API usage:")
+            print(json.dumps(manager.rate_limiter.stats(), indent=2))
+        if manager.instrumentation.enabled:
+            output_metrics(manager.instrumentation, args.metrics or "json", args.metrics_file)
+
+
+def run_command(manager: StreakManager, args: argparse.Namespace, parser: argparse.ArgumentParser,
+                pacing: PacingPolicy) -> None:
+    """Run the CLI command selected by the parsed arguments.
+    
+    Args:
+        manager: Configured StreakManager
+        args: Parsed command line arguments
+        parser: Argument parser, used to print help
+        pacing: Pacing policy for batch operations
+    """
+    # Serve JSON-RPC requests
+    if args.daemon:
+        daemon = StreakDaemon(manager, pacing)
+        if args.port is not None:
+            daemon.serve_http(port=args.port)
+        else:
+            daemon.serve_unix(os.path.expanduser(args.socket))
         return
     
     # List repositories
@@ -1010,12 +3900,56 @@ def main():
             print(f"{i}. {repo['name']} (Last updated: {repo['updated_at']})")
         return
     
+    # Analyze streaks of several users
+    if args.analyze and args.usernames:
+        reports = manager.analyze_streaks(args.usernames)
+        for username, streak_info in reports.items():
+            print(f"{username}: current streak {streak_info['current_streak']} days, "
+                  f"longest streak {streak_info['longest_streak']} days, "
+                  f"last commit {streak_info['last_commit_date']}")
+        return
+    
+    # Export calendars
+    if args.export:
+        fmt = args.export_format
+        if not fmt:
+            extension = os.path.splitext(args.export)[1].lstrip(".").lower()
+            fmt = {"jsonl": "jsonl", "bin": "columnar", "col": "columnar"}.get(extension, "csv")
+        
+        usernames = args.usernames or [args.username or manager._authenticated_login()]
+        rows = write_export(manager.iter_contribution_calendars(usernames, history=args.history), args.export, fmt)
+        if args.export != "-":
+            print(f"Exported {rows} days for {len(usernames)} users to {args.export} ({fmt})")
+        return
+    
+    # Report gaps per month
+    if args.gaps:
+        end = datetime.datetime.strptime(args.end_date, "%Y-%m-%d").date() if args.end_date else datetime.date.today()
+        if args.start_date:
+            start = datetime.datetime.strptime(args.start_date, "%Y-%m-%d").date()
+        else:
+            start = end - datetime.timedelta(days=args.days_back)
+        
+        # The default calendar covers the last year; days before it would all count as missing
+        history = args.history or start < datetime.date.today() - datetime.timedelta(days=365)
+        gaps = manager.gap_index(args.username, history=history)
+        print(f"Missing days from {start} to {end}: {gaps.count_between(start, end)}")
+        for month, count in gaps.count_per_month(start, end).items():
+            print(f"- {month}: {count}")
+        
+        longest = gaps.longest_gap()
+        if longest:
+            print(f"Longest gap: {(longest[1] - longest[0]).days + 1} days ({longest[0]} to {longest[1]})")
+        return
+    
     # Analyze streak
     if args.analyze:
-        streak_info = manager.analyze_streak(args.username)
+        streak_info = manager.analyze_streak(args.username, history=args.history)
         print(f"Current streak: {streak_info['current_streak']} days")
         print(f"Longest streak: {streak_info['longest_streak']} days")
         print(f"Last commit: {streak_info['last_commit_date']}")
+        print(f"Contributions in the last 7/30 days: {streak_info['contributions_last_7_days']}"
+              f"/{streak_info['contributions_last_30_days']}")
         
         if streak_info['missing_dates']:
             print("Missing dates in your recent history:")
@@ -1026,6 +3960,90 @@ def main():
                 print(f"... and {len(streak_info['missing_dates']) - 10} more")
         return
     
+    # Execute plans on several repositories
+    if args.repos and (args.plan or ((args.natural_pattern or args.bulk) and args.start_date and args.end_date)):
+        plans = {}
+        run = None
+        if args.plan:
+            shared_plan = CommitPlan.load(args.plan)
+            plans = {repo_path: shared_plan for repo_path in args.repos}
+        elif args.natural_pattern:
+            run = _planner_run("natural", start_date=args.start_date, end_date=args.end_date,
+                               reference_username=args.reference_user, max_daily_commits=args.max_daily_commits,
+                               seed=args.seed)
+        else:
+            dates = _date_range(args.start_date, args.end_date)
+            run = _planner_run("bulk", dates=dates, commit_count=args.count, seed=args.seed)
+        
+        if run is not None:
+            for repo_path in args.repos:
+                plan = None
+                if args.resume:
+                    try:
+                        plan = manager.resumable_plan(repo_path, run)
+                    except ValueError:
+                        pass  # Reported by the repository's worker
+                
+                if plan is None and args.natural_pattern:
+                    # The reference user's calendar is cached, so it is only fetched once
+                    plan = manager.plan_natural_streak_pattern(
+                        start_date=args.start_date,
+                        end_date=args.end_date,
+                        reference_username=args.reference_user,
+                        max_daily_commits=args.max_daily_commits,
+                        seed=args.seed
+                    )
+                elif plan is None:
+                    plan = manager.plan_bulk_backdate(dates, args.count, args.seed)
+                plans[repo_path] = plan
+        
+        print(f"Executing plans in {len(plans)} repositories...")
+        reports = manager.execute_plans(plans, push=args.push, backend=args.backend, pacing=pacing,
+                                        push_strategy=args.push_strategy, push_every=args.push_every,
+                                        resume=args.resume, run=run, max_workers=args.workers)
+        
+        failed = [repo_path for repo_path, report in reports.items() if report["error"] or report["failed"]]
+        succeeded = sum(report["succeeded"] for report in reports.values())
+        total = sum(len(report["results"]) for report in reports.values())
+        print(f"Successfully processed {succeeded}/{total} dates in {len(reports) - len(failed)}/{len(reports)} "
+              f"repositories")
+        for repo_path in failed:
+            print(f"- {repo_path}: {reports[repo_path]['error'] or str(reports[repo_path]['failed']) + ' dates failed'}")
+        
+        if args.report:
+            with open(args.report, "w") as f:
+                json.dump(reports, f, indent=2)
+            print(f"Report saved to {args.report}")
+        return
+    
+    # Execute a saved plan
+    if args.plan and (args.repo or args.dry_run):
+        plan = CommitPlan.load(args.plan)
+        if args.dry_run:
+            output_plan(plan, dry_run=True)
+            return
+        
+        print(f"Executing plan {args.plan} ({len(plan)} commits) in {args.repo}")
+        results = manager.execute_plan(args.repo, plan, push=args.push, backend=args.backend, pacing=pacing,
+                                       push_strategy=args.push_strategy, push_every=args.push_every,
+                                       resume=args.resume)
+        
+        successes = sum(1 for success in results.values() if success)
+        print(f"Successfully processed {successes}/{len(results)} dates")
+        return
+    
+    # Plan natural streak pattern without executing it
+    if args.natural_pattern and args.start_date and args.end_date and (args.save_plan or args.dry_run):
+        plan = manager.plan_natural_streak_pattern(
+            start_date=args.start_date,
+            end_date=args.end_date,
+            reference_username=args.reference_user,
+            max_daily_commits=args.max_daily_commits,
+            seed=args.seed
+        )
+        output_plan(plan, args.save_plan, args.dry_run)
+        return
+    
     # Create natural streak pattern
     if args.natural_pattern and args.repo and args.start_date and args.end_date:
         print(f"Creating natural commit streak pattern from {args.start_date} to {args.end_date}")
@@ -1040,7 +4058,13 @@ def main():
             end_date=args.end_date,
             reference_username=args.reference_user,
             max_daily_commits=args.max_daily_commits,
-            push=args.push
+            push=args.push,
+            backend=args.backend,
+            pacing=pacing,
+            seed=args.seed,
+            push_strategy=args.push_strategy,
+            push_every=args.push_every,
+            resume=args.resume
         )
         
         # Success statistics already printed in the function
@@ -1049,7 +4073,9 @@ def main():
     # Fill streak
     if args.fill_streak and args.repo:
         print(f"Analyzing contribution history and filling missing dates (last {args.days_back} days)...")
-        results = manager.fill_missing_streak_dates(args.repo, args.days_back, args.push)
+        results = manager.fill_missing_streak_dates(args.repo, args.days_back, args.push,
+                                                  backend=args.backend, pacing=pacing,
+                                                  push_strategy=args.push_strategy, push_every=args.push_every)
         
         if not results:
             print("✅ Your streak is already complete! No missing dates found.")
@@ -1063,18 +4089,18 @@ def main():
         return
     
     # Bulk backdating
-    if args.bulk and args.repo and args.start_date and args.end_date:
-        start = datetime.datetime.strptime(args.start_date, "%Y-%m-%d")
-        end = datetime.datetime.strptime(args.end_date, "%Y-%m-%d")
+    if args.bulk and args.start_date and args.end_date and (args.repo or args.save_plan or args.dry_run):
+        dates = _date_range(args.start_date, args.end_date)
         
-        dates = []
-        current = start
-        while current <= end:
-            dates.append(current.strftime("%Y-%m-%d"))
-            current += datetime.timedelta(days=1)
+        if args.save_plan or args.dry_run:
+            output_plan(manager.plan_bulk_backdate(dates, args.count, args.seed), args.save_plan, args.dry_run)
+            return
         
         print(f"Bulk backdating {len(dates)} dates from {args.start_date} to {args.end_date}")
-        results = manager.bulk_backdate(args.repo, dates, args.count, args.push)
+        results = manager.bulk_backdate(args.repo, dates, args.count, args.push,
+                                        backend=args.backend, pacing=pacing, seed=args.seed,
+                                        push_strategy=args.push_strategy, push_every=args.push_every,
+                                        resume=args.resume)
         
         successes = sum(1 for success in results.values() if success)
         print(f"Successfully backdated {successes}/{len(dates)} dates")
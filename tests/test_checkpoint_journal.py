@@ -0,0 +1,95 @@
+"""Tests for the checkpoint journal of plan executions.
+
+Run with `python -m unittest discover tests` (or pytest); needs git and GitPython.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import subprocess
+import contextlib
+import io
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import JOURNAL_FILE_NAME, CheckpointJournal, CommitPlan, StreakManager  # noqa: E402
+
+
+def git(repo_path: str, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=repo_path, check=True,
+                          capture_output=True, text=True).stdout.strip()
+
+
+class CheckpointJournalTest(unittest.TestCase):
+
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp(prefix="streak-journal-")
+        self.addCleanup(shutil.rmtree, self.workdir, ignore_errors=True)
+
+        self.repo_path = os.path.join(self.workdir, "repo")
+        git(self.workdir, "init", "-q", self.repo_path)
+        git(self.repo_path, "config", "user.name", "Test")
+        git(self.repo_path, "config", "user.email", "test@example.com")
+        git(self.repo_path, "commit", "-q", "--allow-empty", "-m", "Initial commit")
+
+        config_path = os.path.join(self.workdir, "config.ini")
+        with open(config_path, "w") as f:
+            f.write("[github]\ntoken = test\n\n[preferences]\ncache_enabled = no\n")
+        self.manager = StreakManager(config_path)
+
+        self.plan = CommitPlan(["2024-01-01", "2024-01-02", "2024-01-03"])
+        for day, date_str in enumerate(self.plan.dates, 1):
+            self.plan.add_commit(date_str, f"{date_str} 10:00:00", f"streak_updates/{date_str}.md",
+                                 f"Update {day}", f"Update {day}\n")
+
+    def journal(self) -> CheckpointJournal:
+        journal = CheckpointJournal(os.path.join(self.repo_path, ".git", JOURNAL_FILE_NAME))
+        journal.load()
+        return journal
+
+    def execute(self, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.manager.execute_plan(self.repo_path, self.plan, **kwargs)
+
+    def test_record_commits_rejects_gaps(self):
+        journal = CheckpointJournal(os.path.join(self.workdir, "journal.jsonl"))
+        journal.start(self.plan, None, CheckpointJournal.run_description(self.plan))
+        journal.record_commits(0, ["a" * 40])
+
+        with self.assertRaises(ValueError):
+            journal.record_commits(2, ["c" * 40])
+        journal.close()
+        self.assertEqual(journal.shas, ["a" * 40])
+
+    def test_resume_after_failed_commit(self):
+        backdate_commit = self.manager.backdate_commit
+        calls = []
+
+        def fail_second_commit(*args, **kwargs):
+            calls.append(None)
+            return False if len(calls) == 2 else backdate_commit(*args, **kwargs)
+
+        with mock.patch.object(self.manager, "backdate_commit", side_effect=fail_second_commit):
+            results = self.execute()
+
+        # The run stops at the failure instead of committing past it
+        self.assertEqual(results, {"2024-01-01": True, "2024-01-02": False, "2024-01-03": False})
+        journal = self.journal()
+        self.assertEqual(journal.completed, 1)
+        self.assertFalse(journal.finished)
+
+        results = self.execute(resume=True)
+
+        self.assertTrue(all(results.values()))
+        journal = self.journal()
+        self.assertTrue(journal.finished)
+        self.assertEqual(journal.shas, git(self.repo_path, "rev-list", "--reverse", "HEAD~3..HEAD").split())
+        self.assertEqual(git(self.repo_path, "log", "--reverse", "--format=%s", "HEAD~3..HEAD").split("\n"),
+                         ["Update 1", "Update 2", "Update 3"])
+
+
+if __name__ == "__main__":
+    unittest.main()